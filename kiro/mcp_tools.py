@@ -311,7 +311,11 @@ async def generate_anthropic_web_search_sse(
     Yields:
         SSE formatted strings
     """
-    from kiro.streaming_anthropic import format_sse_event
+    from kiro.streaming_anthropic import (
+        MESSAGE_STOP_EVENT,
+        format_sse_event,
+        format_text_delta_event,
+    )
     
     message_id = f"msg_{uuid.uuid4().hex[:24]}"
     summary = generate_search_summary(query, results)
@@ -351,7 +355,7 @@ async def generate_anthropic_web_search_sse(
         "index": 0,
         "delta": {
             "type": "input_json_delta",
-            "partial_json": json.dumps({"query": query})
+            "partial_json": json.dumps({"query": query}, ensure_ascii=False, separators=(",", ":"))
         }
     })
     
@@ -399,11 +403,7 @@ async def generate_anthropic_web_search_sse(
     chunk_size = 100
     for i in range(0, len(summary), chunk_size):
         chunk = summary[i:i + chunk_size]
-        yield format_sse_event("content_block_delta", {
-            "type": "content_block_delta",
-            "index": 2,
-            "delta": {"type": "text_delta", "text": chunk}
-        })
+        yield format_text_delta_event(2, chunk)
     
     # Event N+1: content_block_stop (text)
     yield format_sse_event("content_block_stop", {
@@ -419,9 +419,7 @@ async def generate_anthropic_web_search_sse(
     })
     
     # Event N+3: message_stop
-    yield format_sse_event("message_stop", {
-        "type": "message_stop"
-    })
+    yield MESSAGE_STOP_EVENT
 
 
 # ==================================================================================================
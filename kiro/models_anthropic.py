@@ -27,8 +27,8 @@ Reference: https://docs.anthropic.com/en/api/messages
 """
 
 import time
-from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, Field, model_validator
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
+from pydantic import BaseModel, BeforeValidator, Field, model_validator
 
 
 # ==================================================================================================
@@ -36,6 +36,30 @@ from pydantic import BaseModel, Field, model_validator
 # ==================================================================================================
 
 
+def _fill_missing_type(type_by_key: Dict[str, str]):
+    """
+    Build a before-validator that tags untagged dicts for discriminated unions.
+
+    Clients may omit "type" (e.g. {"text": "hi"}). The discriminator needs the
+    tag to dispatch, so it is inferred from the first distinctive key present.
+    Tagged dicts, model instances and unrecognized input pass through as-is.
+
+    Args:
+        type_by_key: Distinctive key -> "type" tag, checked in order
+
+    Returns:
+        Function for use with BeforeValidator
+    """
+    def fill(value: Any) -> Any:
+        if isinstance(value, dict) and "type" not in value:
+            for key, type_tag in type_by_key.items():
+                if key in value:
+                    return {**value, "type": type_tag}
+        return value
+
+    return fill
+
+
 class TextContentBlock(BaseModel):
     """
     Text content block in Anthropic format.
@@ -146,6 +170,15 @@ class URLImageSource(BaseModel):
     url: str
 
 
+# Image sources are selected by their "type" tag ("base64" or "url");
+# an untagged source is tagged from its "data" or "url" key first
+ImageSource = Annotated[
+    Union[Base64ImageSource, URLImageSource],
+    Field(discriminator="type"),
+    BeforeValidator(_fill_missing_type({"data": "base64", "url": "url"})),
+]
+
+
 class ImageContentBlock(BaseModel):
     """
     Image content block in Anthropic format.
@@ -159,17 +192,37 @@ class ImageContentBlock(BaseModel):
     """
 
     type: Literal["image"] = "image"
-    source: Union[Base64ImageSource, URLImageSource]
-
-
-# Union type for all content blocks (including images and thinking)
-ContentBlock = Union[
-    TextContentBlock,
-    ThinkingContentBlock,
-    ImageContentBlock,
-    ToolUseContentBlock,
-    ToolResultContentBlock,
-    ToolReferenceContentBlock,
+    source: ImageSource
+
+
+# ToolResultContentBlock forward-references ImageContentBlock, which is defined
+# after it. Resolve the reference now so its validator is built at import time
+# instead of lazily on the first request that contains a tool result.
+ToolResultContentBlock.model_rebuild()
+
+
+# Union type for all content blocks (including images and thinking).
+# Discriminated on "type": validation dispatches straight to the matching
+# model instead of trying every variant in turn. Untagged blocks get their
+# "type" inferred from a distinctive key, as the plain Union accepted them.
+ContentBlock = Annotated[
+    Union[
+        TextContentBlock,
+        ThinkingContentBlock,
+        ImageContentBlock,
+        ToolUseContentBlock,
+        ToolResultContentBlock,
+        ToolReferenceContentBlock,
+    ],
+    Field(discriminator="type"),
+    BeforeValidator(_fill_missing_type({
+        "text": "text",
+        "thinking": "thinking",
+        "source": "image",
+        "tool_use_id": "tool_result",
+        "tool_name": "tool_reference",
+        "input": "tool_use",
+    })),
 ]
 
 
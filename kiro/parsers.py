@@ -36,6 +36,22 @@ from loguru import logger
 from kiro.utils import generate_tool_call_id
 
 
+def _dump_arguments(value: Any) -> str:
+    """
+    Serializes tool call arguments to compact JSON, keeping non-ASCII as-is.
+    
+    Same form as the Anthropic SSE encoder, so parser-produced arguments and
+    arguments forwarded verbatim share one wire format.
+    
+    Args:
+        value: Parsed arguments
+    
+    Returns:
+        JSON string
+    """
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
 def find_matching_brace(text: str, start_pos: int) -> int:
     """
     Finds the position of the closing brace considering nesting and strings.
@@ -139,7 +155,7 @@ def parse_bracket_tool_calls(response_text: str) -> List[Dict[str, Any]]:
                 "type": "function",
                 "function": {
                     "name": func_name,
-                    "arguments": json.dumps(args)
+                    "arguments": _dump_arguments(args)
                 }
             })
         except json.JSONDecodeError:
@@ -356,7 +372,7 @@ class AwsEventStreamParser:
         # input can be string or object
         input_data = data.get('input', '')
         if isinstance(input_data, dict):
-            input_str = json.dumps(input_data)
+            input_str = _dump_arguments(input_data)
         else:
             input_str = str(input_data) if input_data else ''
         
@@ -380,7 +396,7 @@ class AwsEventStreamParser:
             # input can be string or object
             input_data = data.get('input', '')
             if isinstance(input_data, dict):
-                input_str = json.dumps(input_data)
+                input_str = _dump_arguments(input_data)
             else:
                 input_str = str(input_data) if input_data else ''
             self.current_tool_call['function']['arguments'] += input_str
@@ -401,14 +417,16 @@ class AwsEventStreamParser:
         args = self.current_tool_call['function']['arguments']
         tool_name = self.current_tool_call['function'].get('name', 'unknown')
         
-        logger.debug(f"Finalizing tool call '{tool_name}' with raw arguments: {repr(args)[:200]}")
+        # repr() and truncation happen in the format spec, so large arguments are
+        # only rendered when DEBUG is actually logged
+        logger.debug("Finalizing tool call '{}' with raw arguments: {!r:.200}", tool_name, args)
         
         if isinstance(args, str):
             if args.strip():
                 try:
                     parsed = json.loads(args)
                     # Ensure result is a JSON string
-                    self.current_tool_call['function']['arguments'] = json.dumps(parsed)
+                    self.current_tool_call['function']['arguments'] = _dump_arguments(parsed)
                     logger.debug(f"Tool '{tool_name}' arguments parsed successfully: {list(parsed.keys()) if isinstance(parsed, dict) else type(parsed)}")
                 except json.JSONDecodeError as e:
                     # Analyze the failure to provide better diagnostics
@@ -442,7 +460,7 @@ class AwsEventStreamParser:
                 self.current_tool_call['function']['arguments'] = "{}"
         elif isinstance(args, dict):
             # If already an object - serialize to string
-            self.current_tool_call['function']['arguments'] = json.dumps(args)
+            self.current_tool_call['function']['arguments'] = _dump_arguments(args)
             logger.debug(f"Tool '{tool_name}' arguments already dict with keys: {list(args.keys())}")
         else:
             # Unknown type - empty object
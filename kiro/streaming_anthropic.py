@@ -32,9 +32,11 @@ Reference: https://docs.anthropic.com/en/api/messages-streaming
 """
 
 import json
+import math
+import os
 import time
 import uuid
-from typing import TYPE_CHECKING, AsyncGenerator, Dict, List, Optional, Any
+from typing import TYPE_CHECKING, AsyncGenerator, Dict, List, Optional, Tuple, Any
 
 import httpx
 from loguru import logger
@@ -61,10 +63,69 @@ try:
 except ImportError:
     debug_logger = None
 
+# orjson is optional: a C encoder for the per-token SSE path, with stdlib fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def generate_message_id() -> str:
     """Generate unique message ID in Anthropic format."""
-    return f"msg_{uuid.uuid4().hex[:24]}"
+    return f"msg_{os.urandom(12).hex()}"
+
+
+def _replace_non_finite(value: Any) -> Any:
+    """
+    Replace NaN/Infinity floats with None, recursing into dicts and lists.
+    
+    Mirrors orjson, which writes non-finite floats as null because NaN and
+    Infinity are not valid JSON.
+    
+    Args:
+        value: JSON-serializable value
+    
+    Returns:
+        Value with every non-finite float replaced by None
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    return value
+
+
+def _json_dumps(data: Any) -> str:
+    """
+    Serialize data to compact JSON with non-ASCII characters kept as-is.
+    
+    All Anthropic SSE payloads use this compact form ("," and ":" without
+    spaces), the same wire format as Anthropic's own API. Uses orjson when
+    installed. Falls back to stdlib json with the same separators, also for
+    values orjson rejects (e.g. integers beyond 64 bits in tool input).
+    
+    Both paths produce the same JSON values: non-finite floats become null in
+    either case. Float spelling may differ in the exponent only (orjson writes
+    1e-7 where stdlib json writes 1e-07).
+    
+    Args:
+        data: JSON-serializable value
+    
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            pass
+    try:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    except ValueError:
+        # NaN/Infinity somewhere in data: write them as null, like orjson
+        return json.dumps(_replace_non_finite(data), ensure_ascii=False, separators=(",", ":"))
 
 
 def format_sse_event(event_type: str, data: Dict[str, Any]) -> str:
@@ -82,7 +143,33 @@ def format_sse_event(event_type: str, data: Dict[str, Any]) -> str:
     Returns:
         Formatted SSE string
     """
-    return f"event: {event_type}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    return f"event: {event_type}\ndata: {_json_dumps(data)}\n\n"
+
+
+def format_text_delta_event(index: int, text: str) -> str:
+    """
+    Format a text_delta content_block_delta event.
+    
+    This is the most frequent event in a stream and its shape is fixed, so the
+    frame is assembled directly and only the text is JSON-encoded. Output is
+    identical to format_sse_event() with the equivalent dict. A single f-string
+    builds the result in one allocation, unlike chained + or a bytearray.
+    
+    Args:
+        index: Content block index
+        text: Text chunk
+    
+    Returns:
+        Formatted SSE string
+    """
+    return (
+        f'event: content_block_delta\ndata: {{"type":"content_block_delta","index":{index},'
+        f'"delta":{{"type":"text_delta","text":{_json_dumps(text)}}}}}\n\n'
+    )
+
+
+# message_stop carries no per-request data, so its frame is built once at import
+MESSAGE_STOP_EVENT = format_sse_event("message_stop", {"type": "message_stop"})
 
 
 def generate_thinking_signature() -> str:
@@ -126,6 +213,28 @@ def _extract_cache_usage_fields(usage: Optional[Dict[str, Any]]) -> Dict[str, in
     return extracted
 
 
+def _parse_tool_input(tool_input: Any) -> Tuple[Any, str]:
+    """
+    Parse tool arguments and produce the JSON text for input_json_delta.
+    
+    Kiro usually sends arguments as a JSON string. When that string parses, it
+    is forwarded as-is instead of being re-serialized from the parsed value.
+    Invalid JSON becomes an empty input.
+    
+    Args:
+        tool_input: Tool arguments as a JSON string or an already-parsed value
+    
+    Returns:
+        Tuple of (parsed input, JSON text for partial_json)
+    """
+    if isinstance(tool_input, str):
+        try:
+            return json.loads(tool_input), tool_input
+        except json.JSONDecodeError:
+            tool_input = {}
+    return tool_input, _json_dumps(tool_input)
+
+
 async def stream_kiro_to_anthropic(
     response: httpx.Response,
     model: str,
@@ -163,8 +272,9 @@ async def stream_kiro_to_anthropic(
     message_id = generate_message_id()
     input_tokens = 0
     output_tokens = 0
-    full_content = ""
-    full_thinking_content = ""
+    # Collected as chunk lists and joined once after the stream ends
+    content_parts: List[str] = []
+    thinking_parts: List[str] = []
     
     # NOTE: Anthropic streaming spec requires input_tokens in message_start (beginning),
     # but Kiro API provides accurate context_usage at the end of stream.
@@ -223,7 +333,7 @@ async def stream_kiro_to_anthropic(
         async for event in parse_kiro_stream(response, first_token_timeout):
             if event.type == "content":
                 content = event.content or ""
-                full_content += content
+                content_parts.append(content)
                 
                 # Close thinking block if it was open and we're now getting regular content
                 if thinking_block_started and thinking_block_index is not None:
@@ -249,18 +359,11 @@ async def stream_kiro_to_anthropic(
                 
                 # Send content delta
                 if content:
-                    yield format_sse_event("content_block_delta", {
-                        "type": "content_block_delta",
-                        "index": text_block_index,
-                        "delta": {
-                            "type": "text_delta",
-                            "text": content
-                        }
-                    })
+                    yield format_text_delta_event(text_block_index, content)
             
             elif event.type == "thinking":
                 thinking_content = event.thinking_content or ""
-                full_thinking_content += thinking_content
+                thinking_parts.append(thinking_content)
                 
                 # Handle thinking content based on mode
                 if FAKE_REASONING_HANDLING == "as_reasoning_content":
@@ -313,14 +416,7 @@ async def stream_kiro_to_anthropic(
                         text_block_started = True
                     
                     if thinking_content:
-                        yield format_sse_event("content_block_delta", {
-                            "type": "content_block_delta",
-                            "index": text_block_index,
-                            "delta": {
-                                "type": "text_delta",
-                                "text": thinking_content
-                            }
-                        })
+                        yield format_text_delta_event(text_block_index, thinking_content)
                 # For "strip" mode, we just skip the thinking content
             
             elif event.type == "tool_use" and event.tool_use:
@@ -400,7 +496,7 @@ async def stream_kiro_to_anthropic(
                             "index": current_block_index,
                             "delta": {
                                 "type": "input_json_delta",
-                                "partial_json": json.dumps({"query": query})
+                                "partial_json": _json_dumps({"query": query})
                             }
                         })
                         
@@ -451,11 +547,7 @@ async def stream_kiro_to_anthropic(
                         chunk_size = 100
                         for i in range(0, len(summary), chunk_size):
                             chunk = summary[i:i + chunk_size]
-                            yield format_sse_event("content_block_delta", {
-                                "type": "content_block_delta",
-                                "index": current_block_index,
-                                "delta": {"type": "text_delta", "text": chunk}
-                            })
+                            yield format_text_delta_event(current_block_index, chunk)
                         
                         # Event: content_block_stop (text)
                         yield format_sse_event("content_block_stop", {
@@ -475,12 +567,8 @@ async def stream_kiro_to_anthropic(
                         "truncation_info": tool.get('_truncation_info', {})
                     })
                 
-                # Parse arguments if string
-                if isinstance(tool_input, str):
-                    try:
-                        tool_input = json.loads(tool_input)
-                    except json.JSONDecodeError:
-                        tool_input = {}
+                # Parse arguments if string, keeping the original JSON text for the delta
+                tool_input, input_json = _parse_tool_input(tool_input)
                 
                 # Send tool_use block start
                 yield format_sse_event("content_block_start", {
@@ -495,7 +583,6 @@ async def stream_kiro_to_anthropic(
                 })
                 
                 # Send tool input as delta
-                input_json = json.dumps(tool_input, ensure_ascii=False)
                 yield format_sse_event("content_block_delta", {
                     "type": "content_block_delta",
                     "index": current_block_index,
@@ -523,6 +610,9 @@ async def stream_kiro_to_anthropic(
             elif event.type == "usage" and event.usage:
                 upstream_cache_usage.update(_extract_cache_usage_fields(event.usage))
         
+        full_content = "".join(content_parts)
+        full_thinking_content = "".join(thinking_parts)
+        
         # Track completion signals for truncation detection
         stream_completed_normally = context_usage_percentage is not None
         
@@ -552,11 +642,7 @@ async def stream_kiro_to_anthropic(
                 tool_name = tc.get("function", {}).get("name", "")
                 tool_input = tc.get("function", {}).get("arguments", {})
                 
-                if isinstance(tool_input, str):
-                    try:
-                        tool_input = json.loads(tool_input)
-                    except json.JSONDecodeError:
-                        tool_input = {}
+                tool_input, input_json = _parse_tool_input(tool_input)
                 
                 yield format_sse_event("content_block_start", {
                     "type": "content_block_start",
@@ -569,7 +655,6 @@ async def stream_kiro_to_anthropic(
                     }
                 })
                 
-                input_json = json.dumps(tool_input, ensure_ascii=False)
                 yield format_sse_event("content_block_delta", {
                     "type": "content_block_delta",
                     "index": current_block_index,
@@ -658,9 +743,7 @@ async def stream_kiro_to_anthropic(
         })
         
         # Send message_stop
-        yield format_sse_event("message_stop", {
-            "type": "message_stop"
-        })
+        yield MESSAGE_STOP_EVENT
         
         # Save truncation info for recovery (tracked by stable identifiers)
         from kiro.truncation_recovery import should_inject_recovery
@@ -60,12 +60,13 @@ except ImportError:
 # Data Classes
 # ==================================================================================================
 
-@dataclass
+@dataclass(slots=True)
 class KiroEvent:
     """
     Unified event from Kiro API stream.
     
     This format is API-agnostic and can be converted to both OpenAI and Anthropic formats.
+    One is created per stream chunk, so it uses __slots__ instead of a per-instance dict.
     
     Attributes:
         type: Event type (content, thinking, tool_use, usage, context_usage, error)
@@ -306,15 +307,19 @@ async def collect_stream_to_result(
         StreamResult with full content, thinking, tool calls, and usage
     """
     result = StreamResult()
-    full_content_for_bracket_tools = ""
+    # Chunks are collected in lists and joined once at the end:
+    # repeated str += is quadratic for long responses
+    content_parts: List[str] = []
+    thinking_parts: List[str] = []
+    all_parts: List[str] = []  # content and thinking in arrival order, for bracket tools
     
     async for event in parse_kiro_stream(response, first_token_timeout, enable_thinking_parser):
         if event.type == "content" and event.content:
-            result.content += event.content
-            full_content_for_bracket_tools += event.content
+            content_parts.append(event.content)
+            all_parts.append(event.content)
         elif event.type == "thinking" and event.thinking_content:
-            result.thinking_content += event.thinking_content
-            full_content_for_bracket_tools += event.thinking_content
+            thinking_parts.append(event.thinking_content)
+            all_parts.append(event.thinking_content)
         elif event.type == "tool_use" and event.tool_use:
             result.tool_calls.append(event.tool_use)
         elif event.type == "usage" and event.usage:
@@ -322,8 +327,11 @@ async def collect_stream_to_result(
         elif event.type == "context_usage" and event.context_usage_percentage is not None:
             result.context_usage_percentage = event.context_usage_percentage
     
+    result.content = "".join(content_parts)
+    result.thinking_content = "".join(thinking_parts)
+    
     # Check for bracket-style tool calls in full content
-    bracket_tool_calls = parse_bracket_tool_calls(full_content_for_bracket_tools)
+    bracket_tool_calls = parse_bracket_tool_calls("".join(all_parts))
     if bracket_tool_calls:
         result.tool_calls = deduplicate_tool_calls(result.tool_calls + bracket_tool_calls)
     
@@ -77,6 +77,23 @@ _tool_truncation_cache: Dict[str, ToolTruncationInfo] = {}
 _content_truncation_cache: Dict[str, ContentTruncationInfo] = {}
 _cache_lock = Lock()
 
+# Only this prefix of the content is hashed (enough to be unique, not too much)
+_CONTENT_HASH_PREFIX_CHARS = 500
+
+
+def _content_key(content: str) -> str:
+    """
+    Compute the stable cache key for truncated content.
+    
+    Args:
+        content: The truncated content
+    
+    Returns:
+        16-char hex hash of the first 500 chars of the content
+    """
+    content_for_hash = content[:_CONTENT_HASH_PREFIX_CHARS]
+    return hashlib.blake2b(content_for_hash.encode(), digest_size=8).hexdigest()
+
 
 def save_tool_truncation(tool_call_id: str, tool_name: str, truncation_info: Dict) -> None:
     """
@@ -144,9 +161,7 @@ def save_content_truncation(content: str) -> str:
     Example:
         >>> content_hash = save_content_truncation("This is truncated conte...")
     """
-    # Use first 500 chars for hash (enough to be unique, not too much)
-    content_for_hash = content[:500]
-    message_hash = hashlib.sha256(content_for_hash.encode()).hexdigest()[:16]
+    message_hash = _content_key(content)
     
     with _cache_lock:
         info = ContentTruncationInfo(
@@ -180,8 +195,7 @@ def get_content_truncation(content: str) -> Optional[ContentTruncationInfo]:
         >>> if info:
         ...     print("This message was truncated in previous response")
     """
-    content_for_hash = content[:500]
-    message_hash = hashlib.sha256(content_for_hash.encode()).hexdigest()[:16]
+    message_hash = _content_key(content)
     
     with _cache_lock:
         info = _content_truncation_cache.pop(message_hash, None)
@@ -190,6 +204,17 @@ def get_content_truncation(content: str) -> Optional[ContentTruncationInfo]:
         return info
 
 
+def clear_truncation_caches() -> None:
+    """
+    Remove all pending tool and content truncation entries.
+    
+    Both caches are cleared under the same lock, so concurrent readers never
+    see one cleared and the other not. Used for test isolation.
+    Thread-safe operation.
+    """
+    with _cache_lock:
+        _tool_truncation_cache.clear()
+        _content_truncation_cache.clear()
 
 
 def get_cache_stats() -> Dict[str, int]:
@@ -207,8 +232,11 @@ def get_cache_stats() -> Dict[str, int]:
         >>> print(f"Content truncations: {stats['content_truncations']}")
     """
     with _cache_lock:
-        return {
-            "tool_truncations": len(_tool_truncation_cache),
-            "content_truncations": len(_content_truncation_cache),
-            "total": len(_tool_truncation_cache) + len(_content_truncation_cache)
-        }
+        tool_count = len(_tool_truncation_cache)
+        content_count = len(_content_truncation_cache)
+    
+    return {
+        "tool_truncations": tool_count,
+        "content_truncations": content_count,
+        "total": tool_count + content_count
+    }
@@ -45,6 +45,7 @@ import json
 import logging
 import sys
 import os
+import re
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -184,24 +185,66 @@ setup_logging_intercept()
 # Must be set BEFORE creating any httpx clients (including in lifespan)
 # httpx automatically picks up HTTP_PROXY, HTTPS_PROXY, ALL_PROXY from environment
 
-if VPN_PROXY_URL:
+# Schemes expected in VPN_PROXY_URL, checked with a single startswith() call
+_SCHEME_PREFIXES = ("http://", "https://", "socks5://", "socks4://", "socks://")
+
+# Fallback for any other RFC 3986 scheme (e.g. socks5h://)
+_URL_SCHEME_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://")
+
+# Always excluded from proxy to avoid routing local requests through it
+_LOCAL_HOSTS = ("127.0.0.1", "localhost")
+
+
+def _has_scheme(url: str) -> bool:
+    """
+    Check whether a proxy URL starts with a scheme.
+    
+    Args:
+        url: Proxy URL
+    
+    Returns:
+        True if the URL starts with "<scheme>://"
+    """
+    return url.startswith(_SCHEME_PREFIXES) or _URL_SCHEME_RE.match(url) is not None
+
+
+def compute_proxy_env(vpn_url: str, no_proxy: str | None) -> dict[str, str]:
+    """
+    Build the proxy environment variables for a VPN/proxy URL.
+    
+    Pure function - does not read or modify os.environ.
+    
+    Args:
+        vpn_url: Proxy URL (scheme optional, defaults to http://)
+        no_proxy: Existing NO_PROXY value, if any (comma-separated)
+    
+    Returns:
+        Mapping of HTTP_PROXY, HTTPS_PROXY, ALL_PROXY and NO_PROXY to their values,
+        or an empty dict if vpn_url is empty (direct connection)
+    """
+    if not vpn_url:
+        return {}
+    
     # Normalize URL - add http:// if no scheme specified
-    proxy_url_with_scheme = VPN_PROXY_URL if "://" in VPN_PROXY_URL else f"http://{VPN_PROXY_URL}"
+    proxy_url_with_scheme = vpn_url if _has_scheme(vpn_url) else f"http://{vpn_url}"
+    
+    # Append local hosts to existing entries, dropping blanks and duplicates (order preserved)
+    no_proxy_hosts = [host.strip() for host in (no_proxy or "").split(",") if host.strip()]
+    merged_no_proxy = ",".join(dict.fromkeys([*no_proxy_hosts, *_LOCAL_HOSTS]))
     
+    return {
+        "HTTP_PROXY": proxy_url_with_scheme,
+        "HTTPS_PROXY": proxy_url_with_scheme,
+        "ALL_PROXY": proxy_url_with_scheme,
+        "NO_PROXY": merged_no_proxy,
+    }
+
+
+if VPN_PROXY_URL:
     # Set environment variables for httpx to pick up automatically
-    os.environ['HTTP_PROXY'] = proxy_url_with_scheme
-    os.environ['HTTPS_PROXY'] = proxy_url_with_scheme
-    os.environ['ALL_PROXY'] = proxy_url_with_scheme
-    
-    # Exclude localhost from proxy to avoid routing local requests through it
-    no_proxy_hosts = os.environ.get("NO_PROXY", "")
-    local_hosts = "127.0.0.1,localhost"
-    if no_proxy_hosts:
-        os.environ["NO_PROXY"] = f"{no_proxy_hosts},{local_hosts}"
-    else:
-        os.environ["NO_PROXY"] = local_hosts
+    os.environ.update(compute_proxy_env(VPN_PROXY_URL, os.environ.get("NO_PROXY")))
     
-    logger.info(f"Proxy configured: {proxy_url_with_scheme}")
+    logger.info(f"Proxy configured: {os.environ['HTTP_PROXY']}")
     logger.debug(f"NO_PROXY: {os.environ['NO_PROXY']}")
 
 
@@ -17,20 +17,41 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
+import importlib.util
 import json
 import os
-import sqlite3
+import re
 import sys
 import uuid
+from contextlib import closing
+from datetime import datetime
 from pathlib import Path
 from enum import Enum
 
 import httpx
-from dotenv import load_dotenv
 from loguru import logger
+from pydantic_core import to_json
+
+# orjson is optional: faster parsing of credential blobs when installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    # python-dotenv is optional here: without it, only exported env vars are used
+    def load_dotenv(*args, **kwargs) -> bool:
+        return False
 
 # --- Load environment variables ---
-load_dotenv()
+# Skip parsing .env when credentials are already exported. The explicit path
+# (next to this script) avoids find_dotenv()'s upward directory search.
+CREDENTIAL_ENV_VARS = ("REFRESH_TOKEN", "KIRO_CREDS_FILE", "KIRO_CLI_DB_FILE")
+if not any(os.environ.get(name) for name in CREDENTIAL_ENV_VARS):
+    load_dotenv(dotenv_path=Path(__file__).resolve().with_name(".env"))
 
 
 class AuthType(Enum):
@@ -50,6 +71,15 @@ KIRO_DESKTOP_TOKEN_URL = f"https://prod.{API_REGION}.auth.desktop.kiro.dev/refre
 SSO_REGION = None
 AWS_SSO_OIDC_TOKEN_URL = None  # Will be set when SSO_REGION is known
 
+# Client identification, shared by the API and token refresh headers
+KIRO_IDE_USER_AGENT = "KiroIDE-0.7.45-31c325a0ff0a9c8dec5d13048f4257462d751fe5b8af4cb1088f1fca45856c64"
+AWS_SDK_USER_AGENT = "aws-sdk-js/1.0.27"
+
+
+def get_aws_sso_oidc_url(region: str) -> str:
+    """Returns the AWS SSO OIDC token endpoint for a region."""
+    return f"https://oidc.{region}.amazonaws.com/token"
+
 REFRESH_TOKEN = os.getenv("REFRESH_TOKEN")
 PROFILE_ARN = os.getenv("PROFILE_ARN", "arn:aws:codewhisperer:us-east-1:699475941385:profile/EHGA3GRVQMUK")
 KIRO_CREDS_FILE = os.getenv("KIRO_CREDS_FILE", "")
@@ -62,6 +92,47 @@ SCOPES = None
 AUTH_TOKEN = None
 AUTH_TYPE = AuthType.KIRO_DESKTOP
 
+# kiro-cli SQLite keys, in priority order (kiro-cli format first, legacy codewhisperer second)
+SQLITE_TOKEN_KEYS = ("kirocli:odic:token", "codewhisperer:odic:token")
+SQLITE_REGISTRATION_KEYS = ("kirocli:odic:device-registration", "codewhisperer:odic:device-registration")
+
+
+def fetch_preferred_auth_value(cursor, keys):
+    """
+    Fetches the auth_kv value for the highest-priority key present.
+
+    All candidate keys are looked up with a single `WHERE key IN (...)` query
+    instead of one SELECT per key.
+
+    Args:
+        cursor: SQLite cursor on the kiro-cli database
+        keys: Candidate keys in priority order
+
+    Returns:
+        Raw value of the first key (by priority) that exists, or None
+    """
+    placeholders = ",".join("?" * len(keys))
+    cursor.execute(f"SELECT key, value FROM auth_kv WHERE key IN ({placeholders})", keys)
+    found = dict(cursor.fetchall())
+    for key in keys:
+        if key in found:
+            return found[key]
+    return None
+
+
+def parse_expires_at(value: str) -> datetime:
+    """
+    Parses kiro-cli's RFC3339 expires_at timestamp.
+
+    Python 3.11+ fromisoformat accepts the trailing 'Z' and nanosecond
+    fractions directly. Older versions need 'Z' rewritten to '+00:00' and
+    the fraction truncated to microseconds.
+    """
+    if sys.version_info >= (3, 11):
+        return datetime.fromisoformat(value)
+    value = re.sub(r'(\.\d{6})\d+', r'\1', value.replace('Z', '+00:00'))
+    return datetime.fromisoformat(value)
+
 
 def load_credentials_from_json(file_path: str) -> bool:
     """Load credentials from JSON file."""
@@ -74,8 +145,7 @@ def load_credentials_from_json(file_path: str) -> bool:
             logger.warning(f"Credentials file not found: {file_path}")
             return False
         
-        with open(creds_path, 'r', encoding='utf-8') as f:
-            creds_data = json.load(f)
+        creds_data = json_loads(creds_path.read_bytes())
         
         # Load common fields
         if 'refreshToken' in creds_data:
@@ -87,7 +157,7 @@ def load_credentials_from_json(file_path: str) -> bool:
             # IMPORTANT: CodeWhisperer API is only available in us-east-1,
             # so we don't update KIRO_API_HOST here
             SSO_REGION = creds_data['region']
-            AWS_SSO_OIDC_TOKEN_URL = f"https://oidc.{SSO_REGION}.amazonaws.com/token"
+            AWS_SSO_OIDC_TOKEN_URL = get_aws_sso_oidc_url(SSO_REGION)
             logger.debug(f"SSO region from JSON: {SSO_REGION} (API stays at {API_REGION})")
         
         # Load AWS SSO OIDC specific fields
@@ -117,30 +187,36 @@ def load_credentials_from_sqlite(db_path: str) -> bool:
     global REFRESH_TOKEN, CLIENT_ID, CLIENT_SECRET, AUTH_TYPE, SCOPES, AUTH_TOKEN
     global SSO_REGION, AWS_SSO_OIDC_TOKEN_URL
     
+    # Imported lazily: only the KIRO_CLI_DB_FILE credential path needs sqlite3
+    import sqlite3
+    
     try:
         path = Path(db_path).expanduser()
         if not path.exists():
             logger.warning(f"SQLite database not found: {db_path}")
             return False
         
-        conn = sqlite3.connect(str(path))
-        cursor = conn.cursor()
-        
-        # Load token data (try both kiro-cli and codewhisperer key formats)
-        cursor.execute("SELECT value FROM auth_kv WHERE key = ?", ("kirocli:odic:token",))
-        token_row = cursor.fetchone()
-        if not token_row:
-            cursor.execute("SELECT value FROM auth_kv WHERE key = ?", ("codewhisperer:odic:token",))
-            token_row = cursor.fetchone()
+        # Open read-only: we only issue SELECTs, so there is no need to take a
+        # write lock or create journal files next to kiro-cli's database.
+        # `immutable=1` is deliberately not used - it would make SQLite ignore
+        # the WAL file and miss tokens kiro-cli has not checkpointed yet.
+        # closing() releases the connection even if a query raises.
+        with closing(sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)) as conn:
+            conn.execute("PRAGMA query_only=1")
+            cursor = conn.cursor()
+            # Try both kiro-cli and codewhisperer key formats
+            token_value = fetch_preferred_auth_value(cursor, SQLITE_TOKEN_KEYS)
+            registration_value = fetch_preferred_auth_value(cursor, SQLITE_REGISTRATION_KEYS)
         
-        if token_row:
-            token_data = json.loads(token_row[0])
+        # Load token data
+        if token_value:
+            token_data = json_loads(token_value)
             if token_data:
                 # Check if we have a valid access token
                 if 'access_token' in token_data and 'expires_at' in token_data:
-                    from datetime import datetime
-                    expires_at = datetime.fromisoformat(token_data['expires_at'].replace('Z', '+00:00'))
-                    if expires_at > datetime.now().astimezone():
+                    expires_at = parse_expires_at(token_data['expires_at'])
+                    now = datetime.now().astimezone()
+                    if expires_at > now:
                         AUTH_TOKEN = token_data['access_token']
                         logger.info("Found valid access token in database (will use after HEADERS init)")
                 if 'refresh_token' in token_data:
@@ -152,26 +228,18 @@ def load_credentials_from_sqlite(db_path: str) -> bool:
                     # IMPORTANT: CodeWhisperer API is only available in us-east-1,
                     # so we don't update KIRO_API_HOST here
                     SSO_REGION = token_data['region']
-                    AWS_SSO_OIDC_TOKEN_URL = f"https://oidc.{SSO_REGION}.amazonaws.com/token"
+                    AWS_SSO_OIDC_TOKEN_URL = get_aws_sso_oidc_url(SSO_REGION)
                     logger.debug(f"SSO region from SQLite: {SSO_REGION} (API stays at {API_REGION})")
         
-        # Load device registration (client_id, client_secret) - try both key formats
-        cursor.execute("SELECT value FROM auth_kv WHERE key = ?", ("kirocli:odic:device-registration",))
-        registration_row = cursor.fetchone()
-        if not registration_row:
-            cursor.execute("SELECT value FROM auth_kv WHERE key = ?", ("codewhisperer:odic:device-registration",))
-            registration_row = cursor.fetchone()
-        
-        if registration_row:
-            registration_data = json.loads(registration_row[0])
+        # Load device registration (client_id, client_secret)
+        if registration_value:
+            registration_data = json_loads(registration_value)
             if registration_data:
                 if 'client_id' in registration_data:
                     CLIENT_ID = registration_data['client_id']
                 if 'client_secret' in registration_data:
                     CLIENT_SECRET = registration_data['client_secret']
         
-        conn.close()
-        
         # Detect auth type
         if CLIENT_ID and CLIENT_SECRET:
             AUTH_TYPE = AuthType.AWS_SSO_OIDC
@@ -213,27 +281,35 @@ if AUTH_TYPE == AuthType.AWS_SSO_OIDC and (not CLIENT_ID or not CLIENT_SECRET):
 
 # Global variables
 AUTH_TOKEN = None
-HEADERS = {
-    "Authorization": None,
+# Built once as httpx.Headers so keys are normalized here rather than on every
+# request; the Authorization header is added after the token is known.
+HEADERS = httpx.Headers({
     "Content-Type": "application/json",
-    "User-Agent": "aws-sdk-js/1.0.27 ua/2.1 os/win32#10.0.19044 lang/js md/nodejs#22.21.1 api/codewhispererstreaming#1.0.27 m/E KiroIDE-0.7.45-31c325a0ff0a9c8dec5d13048f4257462d751fe5b8af4cb1088f1fca45856c64",
-    "x-amz-user-agent": "aws-sdk-js/1.0.27 KiroIDE-0.7.45-31c325a0ff0a9c8dec5d13048f4257462d751fe5b8af4cb1088f1fca45856c64",
+    "User-Agent": (
+        f"{AWS_SDK_USER_AGENT} ua/2.1 os/win32#10.0.19044 lang/js md/nodejs#22.21.1 "
+        f"api/codewhispererstreaming#1.0.27 m/E {KIRO_IDE_USER_AGENT}"
+    ),
+    "x-amz-user-agent": f"{AWS_SDK_USER_AGENT} {KIRO_IDE_USER_AGENT}",
     "x-amzn-codewhisperer-optout": "true",
     "x-amzn-kiro-agent-mode": "vibe",
-}
+})
 
+# HTTP/2 needs the optional `h2` package (pip install httpx[http2]);
+# without it the client falls back to HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
-def refresh_auth_token():
+
+async def refresh_auth_token(client: httpx.AsyncClient):
     """Refreshes AUTH_TOKEN via appropriate endpoint based on auth type."""
     global AUTH_TOKEN, HEADERS
     
     if AUTH_TYPE == AuthType.AWS_SSO_OIDC:
-        return refresh_auth_token_aws_sso_oidc()
+        return await refresh_auth_token_aws_sso_oidc(client)
     else:
-        return refresh_auth_token_kiro_desktop()
+        return await refresh_auth_token_kiro_desktop(client)
 
 
-def refresh_auth_token_kiro_desktop():
+async def refresh_auth_token_kiro_desktop(client: httpx.AsyncClient):
     """Refreshes AUTH_TOKEN via Kiro Desktop Auth endpoint."""
     global AUTH_TOKEN, HEADERS
     logger.info("Refreshing Kiro token via Kiro Desktop Auth...")
@@ -241,11 +317,11 @@ def refresh_auth_token_kiro_desktop():
     payload = {"refreshToken": REFRESH_TOKEN}
     headers = {
         "Content-Type": "application/json",
-        "User-Agent": "KiroIDE-0.7.45-31c325a0ff0a9c8dec5d13048f4257462d751fe5b8af4cb1088f1fca45856c64",
+        "User-Agent": KIRO_IDE_USER_AGENT,
     }
     
     try:
-        response = httpx.post(KIRO_DESKTOP_TOKEN_URL, json=payload, headers=headers)
+        response = await client.post(KIRO_DESKTOP_TOKEN_URL, json=payload, headers=headers)
         response.raise_for_status()
         data = response.json()
         
@@ -268,14 +344,14 @@ def refresh_auth_token_kiro_desktop():
         return False
 
 
-def refresh_auth_token_aws_sso_oidc():
+async def refresh_auth_token_aws_sso_oidc(client: httpx.AsyncClient):
     """Refreshes AUTH_TOKEN via AWS SSO OIDC endpoint."""
     global AUTH_TOKEN, HEADERS
     logger.info("Refreshing Kiro token via AWS SSO OIDC...")
     
     # Determine SSO OIDC URL (use SSO_REGION if set, otherwise fall back to API_REGION)
     sso_region = SSO_REGION or API_REGION
-    oidc_url = AWS_SSO_OIDC_TOKEN_URL or f"https://oidc.{sso_region}.amazonaws.com/token"
+    oidc_url = AWS_SSO_OIDC_TOKEN_URL or get_aws_sso_oidc_url(sso_region)
     
     # AWS SSO OIDC uses form-urlencoded data
     data = {
@@ -297,7 +373,7 @@ def refresh_auth_token_aws_sso_oidc():
                  f"client_id={CLIENT_ID[:8] if CLIENT_ID else 'None'}...")
     
     try:
-        response = httpx.post(oidc_url, data=data, headers=headers)
+        response = await client.post(oidc_url, data=data, headers=headers)
         
         # Log response details for debugging (especially on errors)
         if response.status_code != 200:
@@ -335,14 +411,14 @@ def refresh_auth_token_aws_sso_oidc():
         return False
 
 
-def get_profile_arn():
+async def get_profile_arn(client: httpx.AsyncClient):
     """Gets the profile ARN from ListAvailableProfiles endpoint."""
     global PROFILE_ARN
     logger.info("Getting profile ARN from /ListAvailableProfiles...")
     url = f"{KIRO_API_HOST}/ListAvailableProfiles"
     
     try:
-        response = httpx.get(url, headers=HEADERS)
+        response = await client.get(url, headers=HEADERS)
         response.raise_for_status()
         data = response.json()
         
@@ -362,7 +438,7 @@ def get_profile_arn():
         return False
 
 
-def test_get_models():
+async def test_get_models(client: httpx.AsyncClient):
     """Tests the ListAvailableModels endpoint."""
     logger.info("Testing /ListAvailableModels...")
     url = f"{KIRO_API_HOST}/ListAvailableModels"
@@ -372,7 +448,7 @@ def test_get_models():
     }
 
     try:
-        response = httpx.get(url, headers=HEADERS, params=params)
+        response = await client.get(url, headers=HEADERS, params=params)
         response.raise_for_status()
 
         logger.info(f"Response status: {response.status_code}")
@@ -384,17 +460,23 @@ def test_get_models():
         return False
 
 
-def test_generate_content():
+async def test_generate_content(client: httpx.AsyncClient):
     """Tests the generateAssistantResponse endpoint."""
     logger.info("Testing /generateAssistantResponse...")
     url = f"{KIRO_API_HOST}/generateAssistantResponse"
     
+    # Both IDs come from a single urandom draw. Kiro expects canonical UUID
+    # strings, so keep the dashed form (version=4 sets the v4 version/variant bits)
+    random_bytes = os.urandom(32)
+    continuation_id = str(uuid.UUID(bytes=random_bytes[:16], version=4))
+    conversation_id = str(uuid.UUID(bytes=random_bytes[16:], version=4))
+    
     payload = {
         "conversationState": {
-            "agentContinuationId": str(uuid.uuid4()),
+            "agentContinuationId": continuation_id,
             "agentTaskType": "vibe",
             "chatTriggerType": "MANUAL",
-            "conversationId": str(uuid.uuid4()),
+            "conversationId": conversation_id,
             "currentMessage": {
                 "userInputMessage": {
                     "content": "Hello! Say something short.",
@@ -415,16 +497,22 @@ def test_generate_content():
         payload["profileArn"] = PROFILE_ARN
 
     try:
-        with httpx.stream("POST", url, headers=HEADERS, json=payload) as response:
+        # Serialize with pydantic-core's Rust encoder instead of stdlib json
+        # (HEADERS already carries Content-Type: application/json)
+        async with client.stream("POST", url, headers=HEADERS, content=to_json(payload)) as response:
             response.raise_for_status()
             logger.info(f"Response status: {response.status_code}")
             logger.info("Streaming response:")
 
-            for chunk in response.iter_bytes(chunk_size=1024):
+            # 64 KiB reads: AWS event-stream frames are binary (not line-delimited),
+            # so fewer, larger reads beat 1 KiB chunks
+            async for chunk in response.aiter_bytes(chunk_size=65536):
                 if chunk:
-                    # Try to decode and find JSON
-                    chunk_str = chunk.decode('utf-8', errors='ignore')
-                    logger.debug(f"Chunk: {chunk_str[:200]}...")
+                    # Decode only the logged prefix, and only if DEBUG is actually emitted
+                    logger.opt(lazy=True).debug(
+                        "Chunk: {}...",
+                        lambda: chunk[:200].decode('utf-8', errors='ignore'),
+                    )
 
         logger.success("generateAssistantResponse test COMPLETED")
         return True
@@ -433,39 +521,63 @@ def test_generate_content():
         return False
 
 
-if __name__ == "__main__":
+
+async def main():
+    """Runs the manual API checks: token, profile, models, streaming generation."""
     logger.info(f"Starting Kiro API tests...")
     logger.info(f"  Credentials source: {cred_source}")
     logger.info(f"  Auth type: {AUTH_TYPE.value}")
     logger.info(f"  API Region: {API_REGION}")
     logger.info(f"  SSO Region: {SSO_REGION or 'not set (using API region)'}")
     logger.info(f"  API Host: {KIRO_API_HOST}")
+    logger.info(f"  HTTP/2: {'enabled' if HTTP2_AVAILABLE else 'not available (install h2)'}")
+
+    # One client for the whole run: keeps TCP+TLS connections alive between calls,
+    # so ListAvailableModels and generateAssistantResponse reuse the connection
+    # opened during token refresh/profile lookup instead of handshaking again.
+    # With HTTP/2 the concurrent tests multiplex over a single connection.
+    # Transport-level retries cover dropped connections only; HTTP errors are
+    # still reported by each test. `async with` closes the pool even on errors.
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(60.0),
+        transport=httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            retries=2,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        ),
+    ) as client:
+        # Check if we already have a valid token from the database
+        if AUTH_TOKEN:
+            HEADERS['Authorization'] = f"Bearer {AUTH_TOKEN}"
+            logger.info("Using existing valid access token from database")
+            token_ok = True
+        else:
+            token_ok = await refresh_auth_token(client)
 
-    # Check if we already have a valid token from the database
-    if AUTH_TOKEN:
-        HEADERS['Authorization'] = f"Bearer {AUTH_TOKEN}"
-        logger.info("Using existing valid access token from database")
-        token_ok = True
-    else:
-        token_ok = refresh_auth_token()
-
-    if token_ok:
-        # Get profile ARN dynamically for AWS SSO OIDC users
-        if AUTH_TYPE == AuthType.AWS_SSO_OIDC:
-            get_profile_arn()
+        if token_ok:
+            # Get profile ARN dynamically for AWS SSO OIDC users
+            if AUTH_TYPE == AuthType.AWS_SSO_OIDC:
+                await get_profile_arn(client)
         
-        models_ok = test_get_models()
-        generate_ok = test_generate_content()
-
-        if models_ok and generate_ok:
-            logger.success(f"All tests passed successfully!")
-            logger.success(f"  Auth type: {AUTH_TYPE.value}")
-            logger.success(f"  Credentials: {cred_source}")
+            # Both tests only read HEADERS/PROFILE_ARN, so run them concurrently:
+            # the ListAvailableModels round-trip overlaps with the streaming request
+            models_ok, generate_ok = await asyncio.gather(
+                test_get_models(client), test_generate_content(client)
+            )
+
+            if models_ok and generate_ok:
+                logger.success(f"All tests passed successfully!")
+                logger.success(f"  Auth type: {AUTH_TYPE.value}")
+                logger.success(f"  Credentials: {cred_source}")
+            else:
+                logger.warning(f"One or more tests failed.")
         else:
-            logger.warning(f"One or more tests failed.")
-    else:
-        logger.error("Failed to refresh token. Tests not started.")
-        logger.error(f"  Auth type: {AUTH_TYPE.value}")
-        sso_region = SSO_REGION or API_REGION
-        oidc_url = AWS_SSO_OIDC_TOKEN_URL or f"https://oidc.{sso_region}.amazonaws.com/token"
-        logger.error(f"  Token URL: {oidc_url if AUTH_TYPE == AuthType.AWS_SSO_OIDC else KIRO_DESKTOP_TOKEN_URL}")
+            logger.error("Failed to refresh token. Tests not started.")
+            logger.error(f"  Auth type: {AUTH_TYPE.value}")
+            sso_region = SSO_REGION or API_REGION
+            oidc_url = AWS_SSO_OIDC_TOKEN_URL or get_aws_sso_oidc_url(sso_region)
+            logger.error(f"  Token URL: {oidc_url if AUTH_TYPE == AuthType.AWS_SSO_OIDC else KIRO_DESKTOP_TOKEN_URL}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
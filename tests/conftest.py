@@ -10,6 +10,7 @@ All tests MUST be completely isolated from the network.
 import asyncio
 import json
 import pytest
+import sys
 import time
 from typing import AsyncGenerator, Dict, Any, List
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
@@ -82,13 +83,18 @@ def setup_test_environment(tmp_path_factory):
     creds_file = tmp_dir / "credentials.json"
     creds_file.write_text(json.dumps(credentials_data, indent=2))
     
-    # Patch config paths to use temporary files
+    # Patch config paths to use temporary files.
+    # main.py binds these names at import time, so when a test module already
+    # imported it during collection (e.g. test_vpn_proxy), patch it as well.
     import kiro.config
-    original_creds_file = kiro.config.ACCOUNTS_CONFIG_FILE
-    original_state_file = kiro.config.ACCOUNTS_STATE_FILE
+    modules = [kiro.config]
+    if "main" in sys.modules:
+        modules.append(sys.modules["main"])
+    originals = [(m, m.ACCOUNTS_CONFIG_FILE, m.ACCOUNTS_STATE_FILE) for m in modules]
     
-    kiro.config.ACCOUNTS_CONFIG_FILE = str(creds_file)
-    kiro.config.ACCOUNTS_STATE_FILE = str(tmp_dir / "state.json")
+    for module in modules:
+        module.ACCOUNTS_CONFIG_FILE = str(creds_file)
+        module.ACCOUNTS_STATE_FILE = str(tmp_dir / "state.json")
     
     print(f"✅ Test credentials: {creds_file}")
     print(f"✅ Test state: {tmp_dir / 'state.json'}")
@@ -96,8 +102,9 @@ def setup_test_environment(tmp_path_factory):
     yield
     
     # Restore original paths
-    kiro.config.ACCOUNTS_CONFIG_FILE = original_creds_file
-    kiro.config.ACCOUNTS_STATE_FILE = original_state_file
+    for module, original_creds_file, original_state_file in originals:
+        module.ACCOUNTS_CONFIG_FILE = original_creds_file
+        module.ACCOUNTS_STATE_FILE = original_state_file
     
     print("🧹 Test environment cleaned up")
 
@@ -806,6 +806,50 @@ class TestWebSearchConfig:
         assert config_module.WEB_SEARCH_ENABLED is False
 
 
+# ==================================================================================================
+# Tests for Truncation Recovery Configuration
+# ==================================================================================================
+
+class TestTruncationRecoveryConfig:
+    """Tests for TRUNCATION_RECOVERY configuration."""
+    
+    def test_truncation_recovery_default_true(self, monkeypatch):
+        """
+        What it does: Verifies TRUNCATION_RECOVERY defaults to true.
+        Purpose: Ensure the model is notified about truncation by default.
+        """
+        print("Setup: Removing TRUNCATION_RECOVERY from environment...")
+        monkeypatch.delenv("TRUNCATION_RECOVERY", raising=False)
+        
+        print("Action: Reloading config module...")
+        from importlib import reload
+        import kiro.config as config_module
+        reload(config_module)
+        
+        print(f"Comparing TRUNCATION_RECOVERY: Expected True, Got {config_module.TRUNCATION_RECOVERY}")
+        assert config_module.TRUNCATION_RECOVERY is True
+    
+    @pytest.mark.parametrize("value, expected", [
+        ("false", False), ("0", False), ("off", False),
+        ("true", True), ("1", True), ("YES", True),
+    ])
+    def test_truncation_recovery_from_environment(self, monkeypatch, value, expected):
+        """
+        What it does: Verifies TRUNCATION_RECOVERY parsing of truthy and falsy values.
+        Purpose: Ensure true/1/yes (any case) enable recovery and anything else disables it.
+        """
+        print(f"Setup: Setting TRUNCATION_RECOVERY={value}...")
+        monkeypatch.setenv("TRUNCATION_RECOVERY", value)
+        
+        print("Action: Reloading config module...")
+        from importlib import reload
+        import kiro.config as config_module
+        reload(config_module)
+        
+        print(f"Comparing TRUNCATION_RECOVERY: Expected {expected}, Got {config_module.TRUNCATION_RECOVERY}")
+        assert config_module.TRUNCATION_RECOVERY is expected
+
+
 # ==================================================================================================
 # Tests for Account System Configuration
 # ==================================================================================================
@@ -12,8 +12,10 @@ Comprehensive tests for all Anthropic API models:
 - Error models
 """
 
+from functools import cache
+
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from kiro.models_anthropic import (
     # Content blocks
@@ -63,6 +65,110 @@ from kiro.models_anthropic import (
 # Base64 1x1 pixel JPEG for testing
 TEST_IMAGE_BASE64 = "/9j/4AAQSkZJRgABAQEASABIAAD/2wBDAAgGBgcGBQgHBwcJCQgKDBQNDAsLDBkSEw8UHRofHh0aHBwgJC4nICIsIxwcKDcpLDAxNDQ0Hyc5PTgyPC4zNDL/wAALCAABAAEBAREA/8QAFAABAAAAAAAAAAAAAAAAAAAACf/EABQQAQAAAAAAAAAAAAAAAAAAAAD/2gAIAQEAAD8AVN//2Q=="
 
+# Shared raw request fragments. Validation never mutates its input, so tests
+# may reference these directly; copy before changing them in place.
+_BASE64_IMAGE_SRC = {"type": "base64", "media_type": "image/jpeg", "data": TEST_IMAGE_BASE64}
+_USER_IMAGE_CONTENT = [
+    {"type": "text", "text": "What's in this image?"},
+    {"type": "image", "source": _BASE64_IMAGE_SRC},
+]
+
+
+@cache
+def _type_adapter(tp) -> TypeAdapter:
+    """
+    Validator for the dict-input tests, built on first use and then reused.
+    
+    Building a TypeAdapter compiles the pydantic core schema, so collecting
+    this module does not pay for it and each schema is built at most once.
+    """
+    return TypeAdapter(tp)
+
+
+def make(model, **kwargs):
+    """
+    Builds a model instance from trusted test data without running validation.
+
+    Defaults declared on the model are still applied, so this is suitable for
+    tests that only check default values. Tests that exercise validation must
+    call the regular constructor.
+    """
+    return model.model_construct(**kwargs)
+
+
+def is_missing(error: ValidationError, field: str) -> bool:
+    """
+    Checks whether a ValidationError reports the given top-level field as missing.
+
+    Inspects error.errors() rather than str(error), so the assertion neither
+    depends on pydantic's message wording nor matches the field name inside
+    unrelated text (e.g. "id" in an input URL).
+    """
+    return any(e["loc"] == (field,) and e["type"] == "missing" for e in error.errors())
+
+
+# ==================================================================================================
+# Fixtures
+# ==================================================================================================
+
+@pytest.fixture
+def base_response_kwargs():
+    """
+    Minimal valid AnthropicMessagesResponse arguments.
+
+    Built fresh for each test, since the models are mutable. Pass them with **
+    and add the field under test.
+    """
+    return {
+        "id": "msg_1",
+        "model": "claude-sonnet-4-5",
+        "content": [TextContentBlock(text="Test")],
+        "usage": AnthropicUsage(input_tokens=1, output_tokens=1),
+    }
+
+
+# ==================================================================================================
+# Tests for schema completeness
+# ==================================================================================================
+
+class TestSchemaCompleteness:
+    """Tests that every Anthropic model has its validator built at import time."""
+    
+    def test_all_models_are_complete_after_import(self):
+        """
+        What it does: Verifies that no model is left with unresolved forward references.
+        Purpose: Ensure validators are compiled at import, not on the first request.
+        
+        ToolResultContentBlock references ImageContentBlock before it is defined,
+        so without an explicit model_rebuild() it stays incomplete until first use.
+        """
+        import kiro.models_anthropic as models_module
+        
+        print("Setup: Collecting all Pydantic models from kiro.models_anthropic...")
+        models = [
+            obj for obj in vars(models_module).values()
+            if isinstance(obj, type) and issubclass(obj, BaseModel) and obj is not BaseModel
+        ]
+        print(f"Found {len(models)} models")
+        
+        incomplete = [model.__name__ for model in models if not model.__pydantic_complete__]
+        print(f"Comparing incomplete models: Expected [], Got {incomplete}")
+        assert incomplete == []
+    
+    def test_tool_result_accepts_image_content_after_import(self):
+        """
+        What it does: Verifies the resolved forward reference validates image content.
+        Purpose: Ensure the rebuilt ToolResultContentBlock accepts ImageContentBlock items.
+        """
+        print("Setup: Creating ToolResultContentBlock with image content...")
+        block = ToolResultContentBlock(
+            tool_use_id="call_1",
+            content=[{"type": "image", "source": {"type": "url", "url": "https://example.com/a.png"}}]
+        )
+        
+        print(f"Comparing content[0] class: Expected ImageContentBlock, Got {type(block.content[0]).__name__}")
+        assert isinstance(block.content[0], ImageContentBlock)
+
 
 # ==================================================================================================
 # Tests for Base64ImageSource
@@ -93,62 +199,19 @@ class TestBase64ImageSource:
         print(f"Comparing data: Expected {TEST_IMAGE_BASE64[:20]}..., Got {source.data[:20]}...")
         assert source.data == TEST_IMAGE_BASE64
     
-    def test_type_defaults_to_base64(self):
-        """
-        What it does: Verifies that type defaults to "base64".
-        Purpose: Ensure default value is set correctly.
-        """
-        print("Setup: Creating Base64ImageSource without explicit type...")
-        source = Base64ImageSource(
-            media_type="image/png",
-            data=TEST_IMAGE_BASE64
-        )
-        
-        print(f"Comparing type: Expected 'base64', Got '{source.type}'")
-        assert source.type == "base64"
-    
-    def test_requires_media_type(self):
-        """
-        What it does: Verifies that media_type is required.
-        Purpose: Ensure validation fails without media_type.
-        """
-        print("Setup: Attempting to create Base64ImageSource without media_type...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            Base64ImageSource(data=TEST_IMAGE_BASE64)
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "media_type" in str(exc_info.value)
-    
-    def test_requires_data(self):
-        """
-        What it does: Verifies that data is required.
-        Purpose: Ensure validation fails without data.
-        """
-        print("Setup: Attempting to create Base64ImageSource without data...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            Base64ImageSource(media_type="image/jpeg")
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "data" in str(exc_info.value)
-    
-    def test_accepts_various_media_types(self):
+    @pytest.mark.parametrize("media_type", ["image/jpeg", "image/png", "image/gif", "image/webp"])
+    def test_accepts_various_media_types(self, media_type):
         """
         What it does: Verifies acceptance of various image media types.
         Purpose: Ensure all common image formats are supported.
         """
-        print("Setup: Testing various media types...")
-        media_types = ["image/jpeg", "image/png", "image/gif", "image/webp"]
+        print(f"Testing media_type: {media_type}")
+        source = Base64ImageSource(media_type=media_type, data=TEST_IMAGE_BASE64)
+        assert source.media_type == media_type
         
-        for media_type in media_types:
-            print(f"Testing media_type: {media_type}")
-            source = Base64ImageSource(media_type=media_type, data=TEST_IMAGE_BASE64)
-            assert source.media_type == media_type
-        
-        print("All media types accepted successfully")
+        # data has no per-character validator: the payload is stored as-is, not rescanned or copied
+        print("Checking data is stored without copying...")
+        assert source.data is TEST_IMAGE_BASE64
 
 
 # ==================================================================================================
@@ -175,31 +238,6 @@ class TestURLImageSource:
         
         print(f"Comparing url: Expected 'https://example.com/image.jpg', Got '{source.url}'")
         assert source.url == "https://example.com/image.jpg"
-    
-    def test_type_defaults_to_url(self):
-        """
-        What it does: Verifies that type defaults to "url".
-        Purpose: Ensure default value is set correctly.
-        """
-        print("Setup: Creating URLImageSource without explicit type...")
-        source = URLImageSource(url="https://example.com/image.png")
-        
-        print(f"Comparing type: Expected 'url', Got '{source.type}'")
-        assert source.type == "url"
-    
-    def test_requires_url(self):
-        """
-        What it does: Verifies that url is required.
-        Purpose: Ensure validation fails without url.
-        """
-        print("Setup: Attempting to create URLImageSource without url...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            URLImageSource()
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "url" in str(exc_info.value)
 
 
 # ==================================================================================================
@@ -256,14 +294,14 @@ class TestImageContentBlock:
         Purpose: Ensure model accepts dict that matches Base64ImageSource schema.
         """
         print("Setup: Creating ImageContentBlock with dict source...")
-        block = ImageContentBlock(
-            type="image",
-            source={
+        block = _type_adapter(ImageContentBlock).validate_python({
+            "type": "image",
+            "source": {
                 "type": "base64",
                 "media_type": "image/png",
                 "data": TEST_IMAGE_BASE64
             }
-        )
+        })
         
         print(f"Result: {block}")
         print(f"Comparing source.type: Expected 'base64', Got '{block.source.type}'")
@@ -276,13 +314,13 @@ class TestImageContentBlock:
         Purpose: Ensure model accepts dict that matches URLImageSource schema.
         """
         print("Setup: Creating ImageContentBlock with dict URL source...")
-        block = ImageContentBlock(
-            type="image",
-            source={
+        block = _type_adapter(ImageContentBlock).validate_python({
+            "type": "image",
+            "source": {
                 "type": "url",
                 "url": "https://example.com/test.gif"
             }
-        )
+        })
         
         print(f"Result: {block}")
         print(f"Comparing source.type: Expected 'url', Got '{block.source.type}'")
@@ -301,20 +339,6 @@ class TestImageContentBlock:
         
         print(f"Comparing type: Expected 'image', Got '{block.type}'")
         assert block.type == "image"
-    
-    def test_requires_source(self):
-        """
-        What it does: Verifies that source is required.
-        Purpose: Ensure validation fails without source.
-        """
-        print("Setup: Attempting to create ImageContentBlock without source...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            ImageContentBlock(type="image")
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "source" in str(exc_info.value)
 
 
 # ==================================================================================================
@@ -329,11 +353,12 @@ class TestContentBlockUnion:
         What it does: Verifies ContentBlock accepts TextContentBlock.
         Purpose: Ensure union includes text blocks.
         """
-        print("Setup: Creating TextContentBlock...")
-        block: ContentBlock = TextContentBlock(text="Hello, world!")
+        print("Setup: Validating text dict through the ContentBlock union...")
+        block = _type_adapter(ContentBlock).validate_python({"type": "text", "text": "Hello, world!"})
         
         print(f"Result: {block}")
-        print(f"Comparing type: Expected 'text', Got '{block.type}'")
+        print(f"Comparing class: Expected TextContentBlock, Got {type(block).__name__}")
+        assert isinstance(block, TextContentBlock)
         assert block.type == "text"
         assert block.text == "Hello, world!"
     
@@ -346,13 +371,15 @@ class TestContentBlockUnion:
         Before the fix, ContentBlock union did not include ImageContentBlock,
         causing 422 Validation Error when image content was sent.
         """
-        print("Setup: Creating ImageContentBlock...")
-        block: ContentBlock = ImageContentBlock(
-            source=Base64ImageSource(media_type="image/jpeg", data=TEST_IMAGE_BASE64)
-        )
+        print("Setup: Validating image dict through the ContentBlock union...")
+        block = _type_adapter(ContentBlock).validate_python({
+            "type": "image",
+            "source": {"type": "base64", "media_type": "image/jpeg", "data": TEST_IMAGE_BASE64}
+        })
         
         print(f"Result: {block}")
-        print(f"Comparing type: Expected 'image', Got '{block.type}'")
+        print(f"Comparing class: Expected ImageContentBlock, Got {type(block).__name__}")
+        assert isinstance(block, ImageContentBlock)
         assert block.type == "image"
         assert block.source.type == "base64"
     
@@ -361,15 +388,17 @@ class TestContentBlockUnion:
         What it does: Verifies ContentBlock accepts ToolUseContentBlock.
         Purpose: Ensure union includes tool_use blocks.
         """
-        print("Setup: Creating ToolUseContentBlock...")
-        block: ContentBlock = ToolUseContentBlock(
-            id="call_123",
-            name="get_weather",
-            input={"location": "Moscow"}
-        )
+        print("Setup: Validating tool_use dict through the ContentBlock union...")
+        block = _type_adapter(ContentBlock).validate_python({
+            "type": "tool_use",
+            "id": "call_123",
+            "name": "get_weather",
+            "input": {"location": "Moscow"}
+        })
         
         print(f"Result: {block}")
-        print(f"Comparing type: Expected 'tool_use', Got '{block.type}'")
+        print(f"Comparing class: Expected ToolUseContentBlock, Got {type(block).__name__}")
+        assert isinstance(block, ToolUseContentBlock)
         assert block.type == "tool_use"
     
     def test_accepts_tool_result_content_block(self):
@@ -377,15 +406,128 @@ class TestContentBlockUnion:
         What it does: Verifies ContentBlock accepts ToolResultContentBlock.
         Purpose: Ensure union includes tool_result blocks.
         """
-        print("Setup: Creating ToolResultContentBlock...")
-        block: ContentBlock = ToolResultContentBlock(
-            tool_use_id="call_123",
-            content="Weather: Sunny, 25°C"
-        )
+        print("Setup: Validating tool_result dict through the ContentBlock union...")
+        block = _type_adapter(ContentBlock).validate_python({
+            "type": "tool_result",
+            "tool_use_id": "call_123",
+            "content": "Weather: Sunny, 25°C"
+        })
         
         print(f"Result: {block}")
-        print(f"Comparing type: Expected 'tool_result', Got '{block.type}'")
+        print(f"Comparing class: Expected ToolResultContentBlock, Got {type(block).__name__}")
+        assert isinstance(block, ToolResultContentBlock)
         assert block.type == "tool_result"
+    
+    def test_dict_dispatches_by_type_tag(self):
+        """
+        What it does: Verifies dict blocks are validated into the model named by "type".
+        Purpose: Ensure the discriminated union picks the variant from the tag.
+        """
+        print("Setup: Creating AnthropicMessage with one dict block of each type...")
+        message = AnthropicMessage(
+            role="user",
+            content=[
+                {"type": "text", "text": "Hi"},
+                {"type": "thinking", "thinking": "Hmm"},
+                {"type": "image", "source": {"type": "url", "url": "https://example.com/a.png"}},
+                {"type": "tool_use", "id": "call_1", "name": "f", "input": {}},
+                {"type": "tool_result", "tool_use_id": "call_1", "content": "ok"},
+                {"type": "tool_reference", "tool_name": "f"},
+            ]
+        )
+        
+        classes = [type(block) for block in message.content]
+        print(f"Result classes: {[c.__name__ for c in classes]}")
+        assert classes == [
+            TextContentBlock,
+            ThinkingContentBlock,
+            ImageContentBlock,
+            ToolUseContentBlock,
+            ToolResultContentBlock,
+            ToolReferenceContentBlock,
+        ]
+    
+    def test_unknown_type_tag_is_rejected(self):
+        """
+        What it does: Verifies a block with an unknown "type" fails validation.
+        Purpose: Ensure the error names the invalid tag instead of listing every variant.
+        """
+        print("Action: Creating AnthropicMessage with unknown block type (should raise)...")
+        with pytest.raises(ValidationError) as exc_info:
+            AnthropicMessage(role="user", content=[{"type": "video", "url": "x"}])
+        
+        error_types = [e["type"] for e in exc_info.value.errors()]
+        print(f"Error types: {error_types}")
+        # content is Union[str, List[ContentBlock]]: the list branch reports the bad tag
+        assert "union_tag_invalid" in error_types
+    
+    def test_untagged_text_block_is_accepted(self):
+        """
+        What it does: Verifies a dict block without "type" but with "text" validates.
+        Purpose: Regression test - the plain Union accepted untagged text blocks.
+        """
+        print("Action: Creating AnthropicMessage with untagged text block...")
+        message = AnthropicMessage(role="user", content=[{"text": "hi"}])
+        
+        block = message.content[0]
+        print(f"Result: {block}")
+        assert isinstance(block, TextContentBlock)
+        assert block.type == "text"
+        assert block.text == "hi"
+    
+    def test_untagged_image_sources_are_accepted(self):
+        """
+        What it does: Verifies image sources without "type" validate from their keys.
+        Purpose: Regression test - "data" selects base64 and "url" selects url, as before.
+        """
+        print("Action: Creating AnthropicMessage with untagged image block and sources...")
+        message = AnthropicMessage(
+            role="user",
+            content=[
+                {"type": "image", "source": {"media_type": "image/png", "data": TEST_IMAGE_BASE64}},
+                {"source": {"url": "https://example.com/a.png"}},
+            ]
+        )
+        
+        sources = [block.source for block in message.content]
+        print(f"Result: {sources}")
+        assert all(isinstance(block, ImageContentBlock) for block in message.content)
+        assert isinstance(sources[0], Base64ImageSource)
+        assert sources[0].type == "base64"
+        assert isinstance(sources[1], URLImageSource)
+        assert sources[1].type == "url"
+    
+    def test_unrecognized_untagged_block_is_rejected(self):
+        """
+        What it does: Verifies a dict block with no "type" and no known key fails validation.
+        Purpose: Ensure tag inference does not guess a variant for arbitrary input.
+        """
+        print("Action: Creating AnthropicMessage with unrecognizable block (should raise)...")
+        with pytest.raises(ValidationError) as exc_info:
+            AnthropicMessage(role="user", content=[{"foo": "bar"}])
+        
+        error_types = [e["type"] for e in exc_info.value.errors()]
+        print(f"Error types: {error_types}")
+        assert "union_tag_not_found" in error_types
+    
+    def test_image_source_dispatches_by_type_tag(self):
+        """
+        What it does: Verifies the image source union is discriminated on "type".
+        Purpose: Ensure base64/url sources validate into the matching model and bad tags fail.
+        """
+        print("Setup: Creating image blocks with base64 and url dict sources...")
+        base64_block = ImageContentBlock(
+            source={"type": "base64", "media_type": "image/png", "data": TEST_IMAGE_BASE64}
+        )
+        url_block = ImageContentBlock(source={"type": "url", "url": "https://example.com/a.png"})
+        
+        assert isinstance(base64_block.source, Base64ImageSource)
+        assert isinstance(url_block.source, URLImageSource)
+        
+        print("Action: Creating image block with unknown source type (should raise)...")
+        with pytest.raises(ValidationError) as exc_info:
+            ImageContentBlock(source={"type": "file", "file_id": "f_1"})
+        assert exc_info.value.errors()[0]["type"] == "union_tag_invalid"
 
 
 # ==================================================================================================
@@ -407,6 +549,9 @@ class TestAnthropicMessageWithImages:
         
         Before the fix, this would raise a ValidationError because
         ContentBlock union did not include ImageContentBlock.
+        
+        Kept on pre-built model instances to cover that input path; the
+        other image tests pass raw dicts, as the API receives them.
         """
         print("Setup: Creating AnthropicMessage with image content...")
         message = AnthropicMessage(
@@ -443,9 +588,9 @@ class TestAnthropicMessageWithImages:
         This is how the actual API request comes in - as raw dicts, not Pydantic models.
         """
         print("Setup: Creating AnthropicMessage with dict image content...")
-        message = AnthropicMessage(
-            role="user",
-            content=[
+        message = _type_adapter(AnthropicMessage).validate_python({
+            "role": "user",
+            "content": [
                 {"type": "text", "text": "Describe this image"},
                 {
                     "type": "image",
@@ -456,7 +601,7 @@ class TestAnthropicMessageWithImages:
                     }
                 }
             ]
-        )
+        })
         
         print(f"Result: {message}")
         print(f"Comparing content length: Expected 2, Got {len(message.content)}")
@@ -472,24 +617,15 @@ class TestAnthropicMessageWithImages:
         Purpose: Ensure multiple image blocks in one message work correctly.
         """
         print("Setup: Creating AnthropicMessage with multiple images...")
-        message = AnthropicMessage(
-            role="user",
-            content=[
+        message = _type_adapter(AnthropicMessage).validate_python({
+            "role": "user",
+            "content": [
                 {"type": "text", "text": "Compare these images"},
-                {
-                    "type": "image",
-                    "source": {"type": "base64", "media_type": "image/jpeg", "data": TEST_IMAGE_BASE64}
-                },
-                {
-                    "type": "image",
-                    "source": {"type": "base64", "media_type": "image/png", "data": TEST_IMAGE_BASE64}
-                },
-                {
-                    "type": "image",
-                    "source": {"type": "base64", "media_type": "image/webp", "data": TEST_IMAGE_BASE64}
-                }
+                {"type": "image", "source": _BASE64_IMAGE_SRC},
+                {"type": "image", "source": {**_BASE64_IMAGE_SRC, "media_type": "image/png"}},
+                {"type": "image", "source": {**_BASE64_IMAGE_SRC, "media_type": "image/webp"}},
             ]
-        )
+        })
         
         print(f"Result content length: {len(message.content)}")
         assert len(message.content) == 4
@@ -497,6 +633,10 @@ class TestAnthropicMessageWithImages:
         image_blocks = [b for b in message.content if b.type == "image"]
         print(f"Image blocks count: {len(image_blocks)}")
         assert len(image_blocks) == 3
+        
+        # The str validator keeps the input object, so all three share one payload
+        print("Checking image data is shared, not copied...")
+        assert len({id(b.source.data) for b in image_blocks}) == 1
     
     def test_message_with_url_image_validates(self):
         """
@@ -539,26 +679,11 @@ class TestAnthropicMessagesRequestWithImages:
         This simulates the actual request that was failing with 422 error.
         """
         print("Setup: Creating full AnthropicMessagesRequest with image...")
-        request = AnthropicMessagesRequest(
-            model="claude-sonnet-4-5",
-            max_tokens=1024,
-            messages=[
-                AnthropicMessage(
-                    role="user",
-                    content=[
-                        {"type": "text", "text": "What's in this image?"},
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/jpeg",
-                                "data": TEST_IMAGE_BASE64
-                            }
-                        }
-                    ]
-                )
-            ]
-        )
+        request = _type_adapter(AnthropicMessagesRequest).validate_python({
+            "model": "claude-sonnet-4-5",
+            "max_tokens": 1024,
+            "messages": [{"role": "user", "content": _USER_IMAGE_CONTENT}]
+        })
         
         print(f"Result: {request}")
         print(f"Comparing model: Expected 'claude-sonnet-4-5', Got '{request.model}'")
@@ -582,20 +707,7 @@ class TestAnthropicMessagesRequestWithImages:
             model="claude-sonnet-4-5",
             max_tokens=1024,
             messages=[
-                AnthropicMessage(
-                    role="user",
-                    content=[
-                        {"type": "text", "text": "What's in this image?"},
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/jpeg",
-                                "data": TEST_IMAGE_BASE64
-                            }
-                        }
-                    ]
-                ),
+                AnthropicMessage(role="user", content=_USER_IMAGE_CONTENT),
                 AnthropicMessage(
                     role="assistant",
                     content="I can see a small test image."
@@ -644,31 +756,6 @@ class TestTextContentBlock:
         print(f"Comparing text: Expected 'Hello, world!', Got '{block.text}'")
         assert block.text == "Hello, world!"
     
-    def test_type_defaults_to_text(self):
-        """
-        What it does: Verifies that type defaults to "text".
-        Purpose: Ensure default value is set correctly.
-        """
-        print("Setup: Creating TextContentBlock without explicit type...")
-        block = TextContentBlock(text="Test")
-        
-        print(f"Comparing type: Expected 'text', Got '{block.type}'")
-        assert block.type == "text"
-    
-    def test_requires_text(self):
-        """
-        What it does: Verifies that text is required.
-        Purpose: Ensure validation fails without text.
-        """
-        print("Setup: Attempting to create TextContentBlock without text...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            TextContentBlock()
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "text" in str(exc_info.value)
-    
     def test_accepts_empty_string(self):
         """
         What it does: Verifies that empty string is accepted.
@@ -722,41 +809,16 @@ class TestThinkingContentBlock:
         print(f"Comparing signature: Expected 'abc123', Got '{block.signature}'")
         assert block.signature == "abc123"
     
-    def test_type_defaults_to_thinking(self):
-        """
-        What it does: Verifies that type defaults to "thinking".
-        Purpose: Ensure default value is set correctly.
-        """
-        print("Setup: Creating ThinkingContentBlock without explicit type...")
-        block = ThinkingContentBlock(thinking="Test thinking")
-        
-        print(f"Comparing type: Expected 'thinking', Got '{block.type}'")
-        assert block.type == "thinking"
-    
     def test_signature_defaults_to_empty(self):
         """
         What it does: Verifies that signature defaults to empty string.
         Purpose: Ensure default value is set correctly.
         """
         print("Setup: Creating ThinkingContentBlock without signature...")
-        block = ThinkingContentBlock(thinking="Test")
+        block = make(ThinkingContentBlock, thinking="Test")
         
         print(f"Comparing signature: Expected '', Got '{block.signature}'")
         assert block.signature == ""
-    
-    def test_requires_thinking(self):
-        """
-        What it does: Verifies that thinking is required.
-        Purpose: Ensure validation fails without thinking.
-        """
-        print("Setup: Attempting to create ThinkingContentBlock without thinking...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            ThinkingContentBlock()
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "thinking" in str(exc_info.value)
 
 
 # ==================================================================================================
@@ -791,59 +853,6 @@ class TestToolUseContentBlock:
         print(f"Comparing input: Got {block.input}")
         assert block.input == {"location": "Moscow", "units": "celsius"}
     
-    def test_type_defaults_to_tool_use(self):
-        """
-        What it does: Verifies that type defaults to "tool_use".
-        Purpose: Ensure default value is set correctly.
-        """
-        print("Setup: Creating ToolUseContentBlock without explicit type...")
-        block = ToolUseContentBlock(id="call_1", name="test", input={})
-        
-        print(f"Comparing type: Expected 'tool_use', Got '{block.type}'")
-        assert block.type == "tool_use"
-    
-    def test_requires_id(self):
-        """
-        What it does: Verifies that id is required.
-        Purpose: Ensure validation fails without id.
-        """
-        print("Setup: Attempting to create ToolUseContentBlock without id...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            ToolUseContentBlock(name="test", input={})
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "id" in str(exc_info.value)
-    
-    def test_requires_name(self):
-        """
-        What it does: Verifies that name is required.
-        Purpose: Ensure validation fails without name.
-        """
-        print("Setup: Attempting to create ToolUseContentBlock without name...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            ToolUseContentBlock(id="call_1", input={})
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "name" in str(exc_info.value)
-    
-    def test_requires_input(self):
-        """
-        What it does: Verifies that input is required.
-        Purpose: Ensure validation fails without input.
-        """
-        print("Setup: Attempting to create ToolUseContentBlock without input...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            ToolUseContentBlock(id="call_1", name="test")
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "input" in str(exc_info.value)
-    
     def test_accepts_empty_input(self):
         """
         What it does: Verifies that empty input dict is accepted.
@@ -870,6 +879,80 @@ class TestToolUseContentBlock:
         
         print(f"Comparing input: Got {block.input}")
         assert block.input == complex_input
+        
+        # Dict[str, Any] copies only the top-level dict; nested payloads are
+        # shared, so large tool arguments are not deep-copied on validation.
+        print("Checking nested values are shared, not deep-copied...")
+        assert block.input["options"] is complex_input["options"]
+        assert block.input["filters"] is complex_input["filters"]
+
+
+# ==================================================================================================
+# Tests for required fields
+# ==================================================================================================
+
+class TestRequiredFields:
+    """Tests that models reject input with a required field missing."""
+    
+    @pytest.mark.parametrize("model,kwargs,missing", [
+        (Base64ImageSource, {"data": TEST_IMAGE_BASE64}, "media_type"),
+        (Base64ImageSource, {"media_type": "image/jpeg"}, "data"),
+        (URLImageSource, {}, "url"),
+        (ImageContentBlock, {"type": "image"}, "source"),
+        (TextContentBlock, {}, "text"),
+        (ThinkingContentBlock, {}, "thinking"),
+        (ToolUseContentBlock, {"name": "test", "input": {}}, "id"),
+        (ToolUseContentBlock, {"id": "call_1", "input": {}}, "name"),
+        (ToolUseContentBlock, {"id": "call_1", "name": "test"}, "input"),
+        (ToolResultContentBlock, {"content": "Result"}, "tool_use_id"),
+        (ToolReferenceContentBlock, {}, "tool_name"),
+        (AnthropicTool, {"input_schema": {}}, "name"),
+        (SystemContentBlock, {}, "text"),
+        (AnthropicUsage, {"output_tokens": 50}, "input_tokens"),
+        (AnthropicUsage, {"input_tokens": 100}, "output_tokens"),
+    ], ids=lambda value: value.__name__ if isinstance(value, type) else None)
+    def test_requires_field(self, model, kwargs, missing):
+        """
+        What it does: Verifies that each required field is enforced.
+        Purpose: Ensure validation fails when the field is omitted.
+        """
+        print(f"Setup: Attempting to create {model.__name__} without {missing}...")
+        
+        print("Action: Creating model (should raise ValidationError)...")
+        with pytest.raises(ValidationError) as exc_info:
+            model(**kwargs)
+        
+        print(f"ValidationError raised: {exc_info.value.error_count()} error(s)")
+        assert is_missing(exc_info.value, missing)
+
+
+# ==================================================================================================
+# Tests for type tag defaults
+# ==================================================================================================
+
+class TestTypeDefaults:
+    """Tests that every tagged model fills in its "type" when it is omitted."""
+    
+    @pytest.mark.parametrize("model,kwargs,expected", [
+        (Base64ImageSource, {"media_type": "image/png", "data": TEST_IMAGE_BASE64}, "base64"),
+        (URLImageSource, {"url": "https://example.com/image.png"}, "url"),
+        (TextContentBlock, {"text": "Test"}, "text"),
+        (ThinkingContentBlock, {"thinking": "Test thinking"}, "thinking"),
+        (ToolUseContentBlock, {"id": "call_1", "name": "test", "input": {}}, "tool_use"),
+        (ToolResultContentBlock, {"tool_use_id": "call_1"}, "tool_result"),
+        (ToolChoiceAuto, {}, "auto"),
+        (ToolChoiceAny, {}, "any"),
+    ], ids=lambda value: value.__name__ if isinstance(value, type) else None)
+    def test_type_default(self, model, kwargs, expected):
+        """
+        What it does: Verifies that type defaults to the model's tag.
+        Purpose: Ensure default value is set correctly.
+        """
+        print(f"Setup: Creating {model.__name__} without explicit type...")
+        instance = make(model, **kwargs)
+        
+        print(f"Comparing type: Expected '{expected}', Got '{instance.type}'")
+        assert instance.type == expected
 
 
 # ==================================================================================================
@@ -890,40 +973,12 @@ class TestToolResultContentBlock:
             content="Weather in Moscow: Sunny, 25°C"
         )
         
-        print(f"Result: {block}")
-        print(f"Comparing type: Expected 'tool_result', Got '{block.type}'")
-        assert block.type == "tool_result"
-        
-        print(f"Comparing tool_use_id: Expected 'call_123', Got '{block.tool_use_id}'")
-        assert block.tool_use_id == "call_123"
-        
-        print(f"Comparing content: Got '{block.content}'")
-        assert block.content == "Weather in Moscow: Sunny, 25°C"
-    
-    def test_type_defaults_to_tool_result(self):
-        """
-        What it does: Verifies that type defaults to "tool_result".
-        Purpose: Ensure default value is set correctly.
-        """
-        print("Setup: Creating ToolResultContentBlock without explicit type...")
-        block = ToolResultContentBlock(tool_use_id="call_1")
-        
-        print(f"Comparing type: Expected 'tool_result', Got '{block.type}'")
-        assert block.type == "tool_result"
-    
-    def test_requires_tool_use_id(self):
-        """
-        What it does: Verifies that tool_use_id is required.
-        Purpose: Ensure validation fails without tool_use_id.
-        """
-        print("Setup: Attempting to create ToolResultContentBlock without tool_use_id...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            ToolResultContentBlock(content="Result")
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "tool_use_id" in str(exc_info.value)
+        print("Comparing model_dump with expected fields...")
+        assert block.model_dump(exclude_none=True) == {
+            "type": "tool_result",
+            "tool_use_id": "call_123",
+            "content": "Weather in Moscow: Sunny, 25°C",
+        }
     
     def test_content_is_optional(self):
         """
@@ -972,7 +1027,7 @@ class TestToolResultContentBlock:
         Purpose: Ensure default value is correct.
         """
         print("Setup: Creating ToolResultContentBlock without is_error...")
-        block = ToolResultContentBlock(tool_use_id="call_1", content="Success")
+        block = make(ToolResultContentBlock, tool_use_id="call_1", content="Success")
         
         print(f"Comparing is_error: Expected None, Got {block.is_error}")
         assert block.is_error is None
@@ -1018,19 +1073,6 @@ class TestToolReferenceContentBlock:
         print(f"Comparing tool_name: Got '{block.tool_name}'")
         assert block.tool_name == "mcp__slack__read_channel"
 
-    def test_requires_tool_name(self):
-        """
-        What it does: Verifies that tool_name is required.
-        Purpose: Ensure validation fails without tool_name.
-        """
-        print("Setup: Attempting to create ToolReferenceContentBlock without tool_name...")
-
-        with pytest.raises(ValidationError) as exc_info:
-            ToolReferenceContentBlock()
-
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "tool_name" in str(exc_info.value)
-
     def test_allows_extra_fields(self):
         """
         What it does: Verifies extra fields are allowed.
@@ -1067,41 +1109,25 @@ class TestAnthropicTool:
         Purpose: Ensure model accepts valid tool definition.
         """
         print("Setup: Creating AnthropicTool with valid data...")
+        input_schema = {
+            "type": "object",
+            "properties": {
+                "location": {"type": "string", "description": "City name"}
+            },
+            "required": ["location"]
+        }
         tool = AnthropicTool(
             name="get_weather",
             description="Get weather for a location",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "location": {"type": "string", "description": "City name"}
-                },
-                "required": ["location"]
-            }
+            input_schema=input_schema
         )
         
-        print(f"Result: {tool}")
-        print(f"Comparing name: Expected 'get_weather', Got '{tool.name}'")
-        assert tool.name == "get_weather"
-        
-        print(f"Comparing description: Got '{tool.description}'")
-        assert tool.description == "Get weather for a location"
-        
-        print(f"Comparing input_schema: Got {tool.input_schema}")
-        assert "properties" in tool.input_schema
-    
-    def test_requires_name(self):
-        """
-        What it does: Verifies that name is required.
-        Purpose: Ensure validation fails without name.
-        """
-        print("Setup: Attempting to create AnthropicTool without name...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            AnthropicTool(input_schema={})
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "name" in str(exc_info.value)
+        print("Comparing model_dump with expected fields...")
+        assert tool.model_dump(exclude_none=True) == {
+            "name": "get_weather",
+            "description": "Get weather for a location",
+            "input_schema": input_schema,
+        }
     
     def test_requires_input_schema(self):
         """
@@ -1114,8 +1140,12 @@ class TestAnthropicTool:
         with pytest.raises(ValidationError) as exc_info:
             AnthropicTool(name="test")
         
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "input_schema" in str(exc_info.value)
+        errors = exc_info.value.errors()
+        print(f"ValidationError raised: {[e['type'] for e in errors]}")
+        # Rejected by the model validator, so the error is a model-level value_error
+        assert errors[0]["type"] == "value_error"
+        assert errors[0]["loc"] == ()
+        assert "input_schema is required" in errors[0]["msg"]
     
     def test_description_is_optional(self):
         """
@@ -1171,8 +1201,10 @@ class TestAnthropicTool:
         with pytest.raises(ValidationError) as exc_info:
             AnthropicTool(**tool_data)
         
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "input_schema is required" in str(exc_info.value)
+        errors = exc_info.value.errors()
+        print(f"ValidationError raised: {[e['type'] for e in errors]}")
+        assert errors[0]["type"] == "value_error"
+        assert "input_schema is required" in errors[0]["msg"]
     
     def test_server_side_tool_all_parameters(self):
         """
@@ -1238,30 +1270,6 @@ class TestAnthropicTool:
 class TestToolChoiceModels:
     """Tests for ToolChoice Pydantic models."""
     
-    def test_tool_choice_auto(self):
-        """
-        What it does: Verifies creation of ToolChoiceAuto.
-        Purpose: Ensure auto tool choice works.
-        """
-        print("Setup: Creating ToolChoiceAuto...")
-        choice = ToolChoiceAuto()
-        
-        print(f"Result: {choice}")
-        print(f"Comparing type: Expected 'auto', Got '{choice.type}'")
-        assert choice.type == "auto"
-    
-    def test_tool_choice_any(self):
-        """
-        What it does: Verifies creation of ToolChoiceAny.
-        Purpose: Ensure any tool choice works.
-        """
-        print("Setup: Creating ToolChoiceAny...")
-        choice = ToolChoiceAny()
-        
-        print(f"Result: {choice}")
-        print(f"Comparing type: Expected 'any', Got '{choice.type}'")
-        assert choice.type == "any"
-    
     def test_tool_choice_tool(self):
         """
         What it does: Verifies creation of ToolChoiceTool.
@@ -1288,8 +1296,8 @@ class TestToolChoiceModels:
         with pytest.raises(ValidationError) as exc_info:
             ToolChoiceTool()
         
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "name" in str(exc_info.value)
+        print(f"ValidationError raised: {exc_info.value.error_count()} error(s)")
+        assert is_missing(exc_info.value, "name")
 
 
 # ==================================================================================================
@@ -1339,20 +1347,6 @@ class TestSystemContentBlock:
         
         print(f"Comparing cache_control: Expected None, Got {block.cache_control}")
         assert block.cache_control is None
-    
-    def test_requires_text(self):
-        """
-        What it does: Verifies that text is required.
-        Purpose: Ensure validation fails without text.
-        """
-        print("Setup: Attempting to create SystemContentBlock without text...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            SystemContentBlock()
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "text" in str(exc_info.value)
 
 
 # ==================================================================================================
@@ -1376,34 +1370,6 @@ class TestAnthropicUsage:
         
         print(f"Comparing output_tokens: Expected 50, Got {usage.output_tokens}")
         assert usage.output_tokens == 50
-    
-    def test_requires_input_tokens(self):
-        """
-        What it does: Verifies that input_tokens is required.
-        Purpose: Ensure validation fails without input_tokens.
-        """
-        print("Setup: Attempting to create AnthropicUsage without input_tokens...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            AnthropicUsage(output_tokens=50)
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "input_tokens" in str(exc_info.value)
-    
-    def test_requires_output_tokens(self):
-        """
-        What it does: Verifies that output_tokens is required.
-        Purpose: Ensure validation fails without output_tokens.
-        """
-        print("Setup: Attempting to create AnthropicUsage without output_tokens...")
-        
-        print("Action: Creating model (should raise ValidationError)...")
-        with pytest.raises(ValidationError) as exc_info:
-            AnthropicUsage(input_tokens=100)
-        
-        print(f"ValidationError raised: {exc_info.value}")
-        assert "output_tokens" in str(exc_info.value)
 
 
 # ==================================================================================================
@@ -1426,52 +1392,35 @@ class TestAnthropicMessagesResponse:
             usage=AnthropicUsage(input_tokens=10, output_tokens=5)
         )
         
-        print(f"Result: {response}")
-        print(f"Comparing id: Expected 'msg_123', Got '{response.id}'")
-        assert response.id == "msg_123"
-        
-        print(f"Comparing type: Expected 'message', Got '{response.type}'")
-        assert response.type == "message"
-        
-        print(f"Comparing role: Expected 'assistant', Got '{response.role}'")
-        assert response.role == "assistant"
-        
-        print(f"Comparing model: Expected 'claude-sonnet-4-5', Got '{response.model}'")
-        assert response.model == "claude-sonnet-4-5"
+        print("Comparing model_dump with expected fields...")
+        assert response.model_dump(exclude_none=True) == {
+            "id": "msg_123",
+            "type": "message",
+            "role": "assistant",
+            "content": [{"type": "text", "text": "Hello!"}],
+            "model": "claude-sonnet-4-5",
+            "usage": {"input_tokens": 10, "output_tokens": 5},
+        }
     
-    def test_stop_reason_values(self):
+    @pytest.mark.parametrize("reason", ["end_turn", "max_tokens", "stop_sequence", "tool_use"])
+    def test_stop_reason_values(self, base_response_kwargs, reason):
         """
         What it does: Verifies that stop_reason accepts valid values.
         Purpose: Ensure all stop reasons work.
         """
-        print("Setup: Testing various stop_reason values...")
-        stop_reasons = ["end_turn", "max_tokens", "stop_sequence", "tool_use"]
-        
-        for reason in stop_reasons:
-            print(f"Testing stop_reason: {reason}")
-            response = AnthropicMessagesResponse(
-                id="msg_1",
-                model="claude-sonnet-4-5",
-                content=[TextContentBlock(text="Test")],
-                usage=AnthropicUsage(input_tokens=1, output_tokens=1),
-                stop_reason=reason
-            )
-            assert response.stop_reason == reason
+        print(f"Setup: Creating response with stop_reason={reason}...")
+        response = AnthropicMessagesResponse(**base_response_kwargs, stop_reason=reason)
         
-        print("All stop_reason values accepted successfully")
+        print(f"Comparing stop_reason: Expected '{reason}', Got '{response.stop_reason}'")
+        assert response.stop_reason == reason
     
-    def test_stop_reason_is_optional(self):
+    def test_stop_reason_is_optional(self, base_response_kwargs):
         """
         What it does: Verifies that stop_reason is optional.
         Purpose: Ensure responses without stop_reason work.
         """
         print("Setup: Creating response without stop_reason...")
-        response = AnthropicMessagesResponse(
-            id="msg_1",
-            model="claude-sonnet-4-5",
-            content=[TextContentBlock(text="Test")],
-            usage=AnthropicUsage(input_tokens=1, output_tokens=1)
-        )
+        response = AnthropicMessagesResponse(**base_response_kwargs)
         
         print(f"Comparing stop_reason: Expected None, Got {response.stop_reason}")
         assert response.stop_reason is None
@@ -1484,157 +1433,36 @@ class TestAnthropicMessagesResponse:
 class TestStreamingEvents:
     """Tests for streaming event Pydantic models."""
     
-    def test_message_start_event(self):
-        """
-        What it does: Verifies creation of MessageStartEvent.
-        Purpose: Ensure message_start event works.
-        """
-        print("Setup: Creating MessageStartEvent...")
-        event = MessageStartEvent(
-            message={"id": "msg_1", "type": "message", "role": "assistant"}
-        )
-        
-        print(f"Result: {event}")
-        print(f"Comparing type: Expected 'message_start', Got '{event.type}'")
-        assert event.type == "message_start"
-        assert event.message["id"] == "msg_1"
-    
-    def test_content_block_start_event(self):
-        """
-        What it does: Verifies creation of ContentBlockStartEvent.
-        Purpose: Ensure content_block_start event works.
-        """
-        print("Setup: Creating ContentBlockStartEvent...")
-        event = ContentBlockStartEvent(
-            index=0,
-            content_block={"type": "text", "text": ""}
-        )
-        
-        print(f"Result: {event}")
-        print(f"Comparing type: Expected 'content_block_start', Got '{event.type}'")
-        assert event.type == "content_block_start"
-        assert event.index == 0
-    
-    def test_text_delta(self):
-        """
-        What it does: Verifies creation of TextDelta.
-        Purpose: Ensure text_delta works.
-        """
-        print("Setup: Creating TextDelta...")
-        delta = TextDelta(text="Hello")
-        
-        print(f"Result: {delta}")
-        print(f"Comparing type: Expected 'text_delta', Got '{delta.type}'")
-        assert delta.type == "text_delta"
-        assert delta.text == "Hello"
-    
-    def test_thinking_delta(self):
-        """
-        What it does: Verifies creation of ThinkingDelta.
-        Purpose: Ensure thinking_delta works.
-        """
-        print("Setup: Creating ThinkingDelta...")
-        delta = ThinkingDelta(thinking="Let me think...")
-        
-        print(f"Result: {delta}")
-        print(f"Comparing type: Expected 'thinking_delta', Got '{delta.type}'")
-        assert delta.type == "thinking_delta"
-        assert delta.thinking == "Let me think..."
-    
-    def test_input_json_delta(self):
-        """
-        What it does: Verifies creation of InputJsonDelta.
-        Purpose: Ensure input_json_delta works.
-        """
-        print("Setup: Creating InputJsonDelta...")
-        delta = InputJsonDelta(partial_json='{"loc')
-        
-        print(f"Result: {delta}")
-        print(f"Comparing type: Expected 'input_json_delta', Got '{delta.type}'")
-        assert delta.type == "input_json_delta"
-        assert delta.partial_json == '{"loc'
-    
-    def test_content_block_delta_event(self):
-        """
-        What it does: Verifies creation of ContentBlockDeltaEvent.
-        Purpose: Ensure content_block_delta event works.
-        """
-        print("Setup: Creating ContentBlockDeltaEvent...")
-        event = ContentBlockDeltaEvent(
-            index=0,
-            delta=TextDelta(text="Hello")
-        )
-        
-        print(f"Result: {event}")
-        print(f"Comparing type: Expected 'content_block_delta', Got '{event.type}'")
-        assert event.type == "content_block_delta"
-        assert event.index == 0
-    
-    def test_content_block_stop_event(self):
-        """
-        What it does: Verifies creation of ContentBlockStopEvent.
-        Purpose: Ensure content_block_stop event works.
-        """
-        print("Setup: Creating ContentBlockStopEvent...")
-        event = ContentBlockStopEvent(index=0)
-        
-        print(f"Result: {event}")
-        print(f"Comparing type: Expected 'content_block_stop', Got '{event.type}'")
-        assert event.type == "content_block_stop"
-        assert event.index == 0
-    
-    def test_message_delta_event(self):
-        """
-        What it does: Verifies creation of MessageDeltaEvent.
-        Purpose: Ensure message_delta event works.
-        """
-        print("Setup: Creating MessageDeltaEvent...")
-        event = MessageDeltaEvent(
-            delta={"stop_reason": "end_turn"},
-            usage=MessageDeltaUsage(output_tokens=10)
-        )
-        
-        print(f"Result: {event}")
-        print(f"Comparing type: Expected 'message_delta', Got '{event.type}'")
-        assert event.type == "message_delta"
-        assert event.delta["stop_reason"] == "end_turn"
-    
-    def test_message_stop_event(self):
-        """
-        What it does: Verifies creation of MessageStopEvent.
-        Purpose: Ensure message_stop event works.
-        """
-        print("Setup: Creating MessageStopEvent...")
-        event = MessageStopEvent()
-        
-        print(f"Result: {event}")
-        print(f"Comparing type: Expected 'message_stop', Got '{event.type}'")
-        assert event.type == "message_stop"
-    
-    def test_ping_event(self):
-        """
-        What it does: Verifies creation of PingEvent.
-        Purpose: Ensure ping event works.
-        """
-        print("Setup: Creating PingEvent...")
-        event = PingEvent()
-        
-        print(f"Result: {event}")
-        print(f"Comparing type: Expected 'ping', Got '{event.type}'")
-        assert event.type == "ping"
-    
-    def test_error_event(self):
-        """
-        What it does: Verifies creation of ErrorEvent.
-        Purpose: Ensure error event works.
-        """
-        print("Setup: Creating ErrorEvent...")
-        event = ErrorEvent(error={"type": "invalid_request", "message": "Bad request"})
+    @pytest.mark.parametrize("event_cls,kwargs,expected_type", [
+        (MessageStartEvent, {"message": {"id": "msg_1", "type": "message", "role": "assistant"}}, "message_start"),
+        (ContentBlockStartEvent, {"index": 0, "content_block": {"type": "text", "text": ""}}, "content_block_start"),
+        (TextDelta, {"text": "Hello"}, "text_delta"),
+        (ThinkingDelta, {"thinking": "Let me think..."}, "thinking_delta"),
+        (InputJsonDelta, {"partial_json": '{"loc'}, "input_json_delta"),
+        (ContentBlockDeltaEvent, {"index": 0, "delta": TextDelta(text="Hello")}, "content_block_delta"),
+        (ContentBlockStopEvent, {"index": 0}, "content_block_stop"),
+        (
+            MessageDeltaEvent,
+            {"delta": {"stop_reason": "end_turn"}, "usage": MessageDeltaUsage(output_tokens=10)},
+            "message_delta",
+        ),
+        (MessageStopEvent, {}, "message_stop"),
+        (PingEvent, {}, "ping"),
+        (ErrorEvent, {"error": {"type": "invalid_request", "message": "Bad request"}}, "error"),
+    ], ids=lambda value: value.__name__ if isinstance(value, type) else None)
+    def test_event_creation(self, event_cls, kwargs, expected_type):
+        """
+        What it does: Verifies creation of each streaming event and delta model.
+        Purpose: Ensure the type tag defaults correctly and fields are stored as given.
+        """
+        print(f"Setup: Creating {event_cls.__name__}...")
+        event = event_cls(**kwargs)
         
         print(f"Result: {event}")
-        print(f"Comparing type: Expected 'error', Got '{event.type}'")
-        assert event.type == "error"
-        assert event.error["type"] == "invalid_request"
+        print(f"Comparing type: Expected '{expected_type}', Got '{event.type}'")
+        assert event.type == expected_type
+        for field, value in kwargs.items():
+            assert getattr(event, field) == value
 
 
 # ==================================================================================================
@@ -690,7 +690,24 @@ class TestAwsEventStreamParserFinalizeToolCall:
         
         print(f"Result: {aws_event_parser.tool_calls}")
         assert len(aws_event_parser.tool_calls) == 1
-        assert aws_event_parser.tool_calls[0]["function"]["arguments"] == '{"key": "value"}'
+        assert aws_event_parser.tool_calls[0]["function"]["arguments"] == '{"key":"value"}'
+    
+    def test_finalize_keeps_non_ascii_arguments_compact(self, aws_event_parser):
+        """
+        What it does: Streams a tool call with non-ASCII arguments through the parser.
+        Goal: Ensure arguments are re-serialized compact with UTF-8 kept as-is, not ASCII-escaped.
+        """
+        print("Setup: Tool start and stop events with non-ASCII arguments...")
+        aws_event_parser._process_tool_start_event(
+            {"name": "get_weather", "toolUseId": "call_ru", "input": '{"city": "Москва", "note": "🌍"}'}
+        )
+        
+        print("Action: Finalizing tool call via stop event...")
+        aws_event_parser._process_tool_stop_event({"stop": True})
+        
+        args = aws_event_parser.tool_calls[0]["function"]["arguments"]
+        print(f"Arguments: {args}")
+        assert args == '{"city":"Москва","note":"🌍"}'
     
     def test_finalize_with_dict_arguments(self, aws_event_parser):
         """
@@ -169,6 +169,19 @@ class TestKiroEvent:
         assert event.is_first_thinking_chunk is False
         assert event.is_last_thinking_chunk is False
         print("✓ All default values are correct")
+    
+    def test_uses_slots(self):
+        """
+        What it does: Verifies KiroEvent instances have no per-instance __dict__.
+        Goal: Ensure per-chunk events stay lightweight and reject unknown attributes.
+        """
+        print("Action: Creating event and setting an unknown attribute...")
+        event = KiroEvent(type="content", content="Hello")
+        
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.unknown_field = 1
+        print("✓ KiroEvent uses __slots__")
 
 
 # ==================================================================================================
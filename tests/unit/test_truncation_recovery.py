@@ -10,9 +10,6 @@ Tests cover:
 - Message format validation
 """
 
-import os
-from unittest.mock import patch
-
 import pytest
 
 from kiro.truncation_recovery import (
@@ -22,10 +19,27 @@ from kiro.truncation_recovery import (
 )
 
 
+# Phrases every generated message must contain (checked against lowercased content)
+REQUIRED_TOOL_RESULT_PHRASES = (
+    "truncated",
+    "upstream api",
+    "output size limits",
+    "consequence",
+    "repeating",
+    "adapt",
+)
+
+REQUIRED_USER_MESSAGE_PHRASES = (
+    "truncated",
+    "api",
+    "adapt",
+)
+
+
 class TestRecoveryEnabledCheck:
     """Test suite for recovery enabled/disabled check."""
     
-    def test_should_inject_recovery_when_enabled(self):
+    def test_should_inject_recovery_when_enabled(self, monkeypatch):
         """
         Test Case 2.3: Recovery enabled check (enabled)
         
@@ -34,22 +48,19 @@ class TestRecoveryEnabledCheck:
         """
         print("\n=== Test: Recovery enabled check (enabled) ===")
         
-        # Arrange & Act
-        with patch.dict(os.environ, {"TRUNCATION_RECOVERY": "true"}):
-            # Need to reload config to pick up env change
-            from importlib import reload
-            from kiro import config
-            reload(config)
-            
-            result = should_inject_recovery()
-            print(f"TRUNCATION_RECOVERY=true → should_inject_recovery() = {result}")
+        # Arrange: flip the resolved setting (env parsing is covered in test_config)
+        monkeypatch.setattr("kiro.config.TRUNCATION_RECOVERY", True)
+        
+        # Act
+        result = should_inject_recovery()
+        print(f"TRUNCATION_RECOVERY=True → should_inject_recovery() = {result}")
         
         # Assert
         assert result is True, "Should return True when TRUNCATION_RECOVERY=true"
         
         print("✅ Test passed: Recovery enabled check works")
     
-    def test_should_inject_recovery_when_disabled(self):
+    def test_should_inject_recovery_when_disabled(self, monkeypatch):
         """
         Test Case 2.3: Recovery enabled check (disabled)
         
@@ -58,15 +69,12 @@ class TestRecoveryEnabledCheck:
         """
         print("\n=== Test: Recovery enabled check (disabled) ===")
         
-        # Arrange & Act
-        with patch.dict(os.environ, {"TRUNCATION_RECOVERY": "false"}):
-            # Need to reload config to pick up env change
-            from importlib import reload
-            from kiro import config
-            reload(config)
-            
-            result = should_inject_recovery()
-            print(f"TRUNCATION_RECOVERY=false → should_inject_recovery() = {result}")
+        # Arrange: flip the resolved setting (env parsing is covered in test_config)
+        monkeypatch.setattr("kiro.config.TRUNCATION_RECOVERY", False)
+        
+        # Act
+        result = should_inject_recovery()
+        print(f"TRUNCATION_RECOVERY=False → should_inject_recovery() = {result}")
         
         # Assert
         assert result is False, "Should return False when TRUNCATION_RECOVERY=false"
@@ -108,53 +116,48 @@ class TestToolTruncationMessage:
         assert isinstance(content, str), "Content should be string"
         assert len(content) > 0, "Content should not be empty"
         
-        # Assert - Key phrases present
+        # Assert - Marker (case-sensitive)
         assert "[API Limitation]" in content, "Should contain [API Limitation] marker"
-        assert "truncated" in content.lower(), "Should mention truncation"
-        assert "upstream api" in content.lower(), "Should mention upstream API"
-        assert "output size limits" in content.lower(), "Should mention size limits"
         
-        # Assert - Universal formulation (conditional language)
-        assert "if" in content.lower() or "likely" in content.lower(), "Should use conditional language"
-        assert "consequence" in content.lower(), "Should explain error is consequence"
+        # Assert - Key phrases: truncation, upstream API, size limits,
+        # consequence, repetition warning, adaptation
+        content_lower = content.lower()
+        for phrase in REQUIRED_TOOL_RESULT_PHRASES:
+            assert phrase in content_lower, f"Should contain phrase: '{phrase}'"
         
-        # Assert - Warning about repetition
-        assert "repeating" in content.lower(), "Should warn about repeating"
-        assert "adapt" in content.lower(), "Should suggest adaptation"
+        # Assert - Universal formulation (conditional language)
+        assert "if" in content_lower or "likely" in content_lower, "Should use conditional language"
         
         print("✅ Test passed: Tool truncation message format correct")
     
-    def test_generate_truncation_tool_result_different_tools(self):
+    @pytest.mark.parametrize("tool_name, tool_id", [
+        ("write_to_file", "tooluse_1"),
+        ("read_file", "tooluse_2"),
+        ("execute_command", "tooluse_3"),
+        ("search_files", "tooluse_4"),
+    ])
+    def test_generate_truncation_tool_result_different_tools(self, tool_name, tool_id):
         """
         Test Case: Generate messages for different tools
         
         What it does: Verify message generation works for various tool names
         Goal: Ensure no tool-specific hardcoding
         """
-        print("\n=== Test: Generate messages for different tools ===")
+        print(f"\n=== Test: Generate message for tool {tool_name} ===")
         
-        # Arrange
-        tools = [
-            ("write_to_file", "tooluse_1"),
-            ("read_file", "tooluse_2"),
-            ("execute_command", "tooluse_3"),
-            ("search_files", "tooluse_4")
-        ]
+        # Act
+        result = generate_truncation_tool_result(
+            tool_name=tool_name,
+            tool_use_id=tool_id,
+            truncation_info={"size_bytes": 1000, "reason": "test"}
+        )
         
-        # Act & Assert
-        for tool_name, tool_id in tools:
-            print(f"Testing tool: {tool_name}")
-            result = generate_truncation_tool_result(
-                tool_name=tool_name,
-                tool_use_id=tool_id,
-                truncation_info={"size_bytes": 1000, "reason": "test"}
-            )
-            
-            assert result["type"] == "tool_result", f"Should work for {tool_name}"
-            assert result["tool_use_id"] == tool_id, f"Should preserve tool_id for {tool_name}"
-            assert "[API Limitation]" in result["content"], f"Should have marker for {tool_name}"
-        
-        print("✅ Test passed: Works for all tool types")
+        # Assert
+        assert result["type"] == "tool_result", f"Should work for {tool_name}"
+        assert result["tool_use_id"] == tool_id, f"Should preserve tool_id for {tool_name}"
+        assert "[API Limitation]" in result["content"], f"Should have marker for {tool_name}"
+        
+        print(f"✅ Test passed: Works for {tool_name}")
     
     def test_generate_truncation_tool_result_no_specific_instructions(self):
         """
@@ -217,18 +220,16 @@ class TestContentTruncationMessage:
         # Assert - Key markers
         assert "[System Notice]" in message, "Should contain [System Notice] marker"
         
-        # Assert - Key phrases
-        assert "truncated" in message.lower(), "Should mention truncation"
-        assert "api" in message.lower(), "Should mention API"
-        assert "output size" in message.lower() or "size limit" in message.lower(), "Should mention size limits"
+        # Assert - Key phrases: truncation, API, adaptation
+        message_lower = message.lower()
+        for phrase in REQUIRED_USER_MESSAGE_PHRASES:
+            assert phrase in message_lower, f"Should contain phrase: '{phrase}'"
+        assert "output size" in message_lower or "size limit" in message_lower, "Should mention size limits"
         
         # Assert - Not model's fault
-        assert "not an error on your part" in message.lower() or "not your fault" in message.lower(), \
+        assert "not an error on your part" in message_lower or "not your fault" in message_lower, \
             "Should clarify it's not model's fault"
         
-        # Assert - Adaptation suggestion
-        assert "adapt" in message.lower(), "Should suggest adaptation"
-        
         print("✅ Test passed: Content truncation message format correct")
     
     def test_generate_truncation_user_message_no_micro_steps(self):
@@ -12,8 +12,7 @@ Tests cover:
 """
 
 import threading
-import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -23,23 +22,35 @@ from kiro.truncation_state import (
     save_content_truncation,
     get_content_truncation,
     get_cache_stats,
+    clear_truncation_caches,
     ToolTruncationInfo,
-    ContentTruncationInfo,
-    _tool_truncation_cache,
-    _content_truncation_cache
+    ContentTruncationInfo
 )
 
 
+# Number of concurrent workers in the thread safety tests
+NUM_RACE_THREADS = 10
+
+
 @pytest.fixture(autouse=True)
 def clear_cache():
     """Clear cache before and after each test to ensure isolation."""
     print("\n[Setup] Clearing truncation cache...")
-    _tool_truncation_cache.clear()
-    _content_truncation_cache.clear()
+    clear_truncation_caches()
     yield
     print("[Teardown] Clearing truncation cache...")
-    _tool_truncation_cache.clear()
-    _content_truncation_cache.clear()
+    clear_truncation_caches()
+
+
+@pytest.fixture(scope="module")
+def executor():
+    """
+    Thread pool shared by the thread safety tests.
+    
+    Sized to NUM_RACE_THREADS so every worker can wait on the barrier at once.
+    """
+    with ThreadPoolExecutor(max_workers=NUM_RACE_THREADS) as pool:
+        yield pool
 
 
 class TestToolTruncation:
@@ -209,8 +220,8 @@ class TestContentTruncation:
         print("\n=== Test: Content hash stability ===")
         
         # Arrange
-        content1 = "A" * 1000  # Long content
-        content2 = "A" * 1000  # Same content
+        content1 = "A" * 32
+        content2 = "".join(["A"] * 32)  # Equal value, separate object
         
         print(f"Saving same content twice (length={len(content1)})...")
         
@@ -239,11 +250,11 @@ class TestContentTruncation:
         print("\n=== Test: Content hash uses first 500 chars ===")
         
         # Arrange
-        content_long = "A" * 10000  # 10k chars
-        content_same_prefix = "A" * 500 + "B" * 9500  # Same first 500 chars
+        content_long = "A" * 500 + "A" * 100  # 600 chars
+        content_same_prefix = "A" * 500 + "B" * 100  # Same first 500 chars
         
         print(f"Content 1: {len(content_long)} chars (all A)")
-        print(f"Content 2: {len(content_same_prefix)} chars (500 A + 9500 B)")
+        print(f"Content 2: {len(content_same_prefix)} chars (500 A + 100 B)")
         
         # Act
         hash1 = save_content_truncation(content_long)
@@ -268,7 +279,7 @@ class TestContentTruncation:
 class TestThreadSafety:
     """Test suite for thread safety of cache operations."""
     
-    def test_concurrent_tool_truncation_saves(self):
+    def test_concurrent_tool_truncation_saves(self, executor):
         """
         Test Case 1.5: Thread safety for tool truncations
         
@@ -278,47 +289,30 @@ class TestThreadSafety:
         print("\n=== Test: Concurrent tool truncation saves ===")
         
         # Arrange
-        num_threads = 10
-        results: List[ToolTruncationInfo] = []
-        errors: List[Exception] = []
+        # Release all workers into the retrieve phase at once to maximize contention
+        barrier = threading.Barrier(NUM_RACE_THREADS)
         
         def save_and_retrieve(tool_id: str):
-            try:
-                print(f"Thread {tool_id}: Saving...")
-                save_tool_truncation(tool_id, f"tool_{tool_id}", {"test": tool_id})
-                time.sleep(0.001)  # Small delay to increase chance of race conditions
-                print(f"Thread {tool_id}: Retrieving...")
-                info = get_tool_truncation(tool_id)
-                if info:
-                    results.append(info)
-            except Exception as e:
-                errors.append(e)
-        
-        # Act
-        print(f"Starting {num_threads} threads...")
-        threads = []
-        for i in range(num_threads):
-            thread = threading.Thread(target=save_and_retrieve, args=(f"tool_{i}",))
-            threads.append(thread)
-            thread.start()
+            save_tool_truncation(tool_id, f"tool_{tool_id}", {"test": tool_id})
+            barrier.wait(timeout=5)
+            return get_tool_truncation(tool_id)
         
-        # Wait for all threads
-        for thread in threads:
-            thread.join()
-        
-        print(f"All threads completed. Results: {len(results)}, Errors: {len(errors)}")
+        # Act - worker exceptions are re-raised here by map()
+        print(f"Starting {NUM_RACE_THREADS} workers...")
+        results = list(executor.map(save_and_retrieve, [f"tool_{i}" for i in range(NUM_RACE_THREADS)]))
+        print(f"All workers completed. Results: {len(results)}")
         
         # Assert
-        assert len(errors) == 0, f"Should have no errors, got: {errors}"
-        assert len(results) == num_threads, f"Should retrieve all {num_threads} entries"
+        assert all(info is not None for info in results), f"Should retrieve all {NUM_RACE_THREADS} entries"
         
         # Verify no cross-contamination
         tool_ids = [info.tool_call_id for info in results]
-        assert len(set(tool_ids)) == num_threads, "All tool_ids should be unique (no cross-contamination)"
+        assert tool_ids == [f"tool_{i}" for i in range(NUM_RACE_THREADS)], \
+            "Each worker should get its own entry (no cross-contamination)"
         
         print("✅ Test passed: Thread-safe operations")
     
-    def test_concurrent_content_truncation_saves(self):
+    def test_concurrent_content_truncation_saves(self, executor):
         """
         Test Case: Thread safety for content truncations
         
@@ -328,40 +322,22 @@ class TestThreadSafety:
         print("\n=== Test: Concurrent content truncation saves ===")
         
         # Arrange
-        num_threads = 10
-        results: List[ContentTruncationInfo] = []
-        errors: List[Exception] = []
+        barrier = threading.Barrier(NUM_RACE_THREADS)
         
         def save_and_retrieve(content: str):
-            try:
-                print(f"Thread {content[:10]}: Saving...")
-                save_content_truncation(content)
-                time.sleep(0.001)
-                print(f"Thread {content[:10]}: Retrieving...")
-                info = get_content_truncation(content)
-                if info:
-                    results.append(info)
-            except Exception as e:
-                errors.append(e)
-        
-        # Act
-        print(f"Starting {num_threads} threads...")
-        threads = []
-        for i in range(num_threads):
-            content = f"Content_{i}_" + "X" * 100
-            thread = threading.Thread(target=save_and_retrieve, args=(content,))
-            threads.append(thread)
-            thread.start()
+            save_content_truncation(content)
+            barrier.wait(timeout=5)
+            return get_content_truncation(content)
         
-        # Wait for all threads
-        for thread in threads:
-            thread.join()
+        contents = [f"Content_{i}_" + "X" * 100 for i in range(NUM_RACE_THREADS)]
         
-        print(f"All threads completed. Results: {len(results)}, Errors: {len(errors)}")
+        # Act - worker exceptions are re-raised here by map()
+        print(f"Starting {NUM_RACE_THREADS} workers...")
+        results = list(executor.map(save_and_retrieve, contents))
+        print(f"All workers completed. Results: {len(results)}")
         
         # Assert
-        assert len(errors) == 0, f"Should have no errors, got: {errors}"
-        assert len(results) == num_threads, f"Should retrieve all {num_threads} entries"
+        assert all(info is not None for info in results), f"Should retrieve all {NUM_RACE_THREADS} entries"
         
         print("✅ Test passed: Thread-safe content operations")
 
@@ -389,6 +365,29 @@ class TestCacheStats:
         
         print("✅ Test passed: Empty cache stats")
     
+    def test_clear_truncation_caches(self):
+        """
+        Test Case: Clearing both caches
+        
+        What it does: Verify clear_truncation_caches() empties tool and content caches
+        Goal: Ensure test isolation helper resets all pending entries
+        """
+        print("\n=== Test: Clear truncation caches ===")
+        
+        # Arrange
+        save_tool_truncation("id1", "tool1", {})
+        save_content_truncation("content1")
+        
+        # Act
+        clear_truncation_caches()
+        stats = get_cache_stats()
+        print(f"Stats after clear: {stats}")
+        
+        # Assert
+        assert stats["total"] == 0, "Both caches should be empty"
+        
+        print("✅ Test passed: Caches cleared")
+    
     def test_cache_stats_with_entries(self):
         """
         Test Case 1.6: Cache stats with entries
@@ -408,10 +407,9 @@ class TestCacheStats:
         stats = get_cache_stats()
         print(f"Stats: {stats}")
         
-        # Assert
-        assert stats["tool_truncations"] == 2, "Should have 2 tool truncations"
-        assert stats["content_truncations"] == 1, "Should have 1 content truncation"
-        assert stats["total"] == 3, "Total should be 3"
+        # Assert - All saved entries are counted
+        assert (stats["tool_truncations"], stats["content_truncations"], stats["total"]) == (2, 1, 3), \
+            "Should have 2 tool truncations, 1 content truncation, 3 total"
         
         # Act - Retrieve one entry
         print("Retrieving one tool truncation...")
@@ -420,8 +418,8 @@ class TestCacheStats:
         stats = get_cache_stats()
         print(f"Stats after retrieval: {stats}")
         
-        # Assert
-        assert stats["tool_truncations"] == 1, "Should have 1 tool truncation left"
-        assert stats["total"] == 2, "Total should be 2"
+        # Assert - Retrieved entry is gone, the rest are counted
+        assert (stats["tool_truncations"], stats["content_truncations"], stats["total"]) == (1, 1, 2), \
+            "Should have 1 tool truncation, 1 content truncation, 2 total"
         
         print("✅ Test passed: Cache stats accurate")